@@ -12,28 +12,146 @@ Usage:
 This script bridges:
     - Pi microphone -> Modem (so caller can hear you)
     - Modem -> Pi speakers (so you can hear caller)
+
+Real-time scheduling:
+    PortAudio callback threads are pinned to AUDIO_CPU and raised to
+    SCHED_FIFO when permitted (run as root or grant CAP_SYS_NICE). For the
+    least jitter, keep other work off that core by adding isolcpus=3 to
+    /boot/cmdline.txt.
 """
 
+import os
 import pyaudio
+import re
+import signal
 import threading
-import time
 import subprocess
 import sys
+from typing import Callable, Optional
+
+# NumPy is optional: frame hooks get int16 arrays when it is installed,
+# and a memoryview cast to 'h' (also zero-copy) when it is not
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 # Audio settings
-CHUNK = 1024
+# 160 frames = 20 ms at 8 kHz, the standard GSM/G.711 frame. Smaller
+# buffers mean more callbacks, but each moves 320 bytes instead of 2 KB.
+CHUNK = 160
 FORMAT = pyaudio.paInt16
 CHANNELS = 1
 RATE = 8000  # Phone audio is typically 8kHz
+SAMPLE_WIDTH = 2  # bytes per paInt16 sample
 
-class AudioBridge:
+# Stream callback return codes
+CONTINUE = pyaudio.paContinue
+COMPLETE = pyaudio.paComplete
+
+# Device name patterns used to guess each device's role in list_devices()
+_MODEM_RE = re.compile(r'sim|qualcomm|modem', re.I)
+_MIC_RE = re.compile(r'usb|mic', re.I)
+_SPK_RE = re.compile(r'bcm|headphone|analog|default', re.I)
+
+# Core and SCHED_FIFO priority for the PortAudio callback threads
+AUDIO_CPU = 3
+AUDIO_PRIORITY = 80
+
+
+def _promote_audio_thread(promoted: set):
+    """
+    Pin the calling thread to AUDIO_CPU and make it SCHED_FIFO
+    
+    Called from inside stream callbacks, since PortAudio owns those
+    threads. Each thread is only adjusted once, tracked in the caller's
+    promoted set; failures (not root, not Linux, fewer cores) leave it on
+    the normal scheduler.
+    """
+    ident = threading.get_ident()
+    if ident in promoted:
+        return
+    promoted.add(ident)
+    
+    try:
+        os.sched_setaffinity(0, {AUDIO_CPU})
+    except (AttributeError, OSError):
+        pass
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(AUDIO_PRIORITY))
+    except (AttributeError, OSError):
+        pass
+
+
+class PingPongBuffer:
+    """
+    Two-slot hand-off between a capture callback and a playback callback
+    
+    With 20 ms buffers one frame in flight is enough, so the capture side
+    just drops its (immutable) in_data into the next slot - no copy - and
+    the playback side returns it. The capture callback is the only writer
+    of ``_written`` and the playback callback the only writer of ``_read``,
+    so no lock is needed between the two PortAudio threads.
+    
+    On underrun the last frame is repeated rather than cutting to silence;
+    if the capture side laps the reader, the oldest frame is skipped.
+    """
+    
     def __init__(self):
-        self.running = False
+        self._slots = [b"", b""]
+        self._written = 0  # Frames stored
+        self._read = 0     # Frames taken
+        self._last = b""
+    
+    def write(self, data: bytes):
+        """Store one captured frame"""
+        self._slots[self._written & 1] = data
+        self._written += 1
+    
+    def read(self, n: int) -> bytes:
+        """Take the next n-byte frame, holding the previous one on underrun"""
+        pending = self._written - self._read
+        if pending > 2:
+            # Overrun: the writer has lapped us, skip to the older live slot
+            self._read = self._written - 2
+        if pending > 0:
+            frame = self._slots[self._read & 1]
+            self._read += 1
+            if len(frame) == n:
+                self._last = frame
+        if len(self._last) != n:
+            # Nothing usable yet (or a buffer size change): play silence
+            self._last = bytes(n)
+        return self._last
+
+
+class AudioBridge:
+    def __init__(self, chunk: int = CHUNK):
+        """
+        Args:
+            chunk: Frames per PortAudio buffer (default 20 ms)
+        """
+        self.chunk = chunk
+        # Checked by every stream callback; cleared to let them complete
+        self.running = threading.Event()
         self.pa = None
         self.mic_stream = None
         self.speaker_stream = None
         self.modem_in = None
         self.modem_out = None
+        self.devices = []
+        # Callback threads already moved to the audio core; their idents
+        # are dropped with the streams, as PortAudio may reuse them
+        self._promoted_threads = set()
+        
+        # Optional DSP hook for microphone audio (gain, AGC, echo cancel...).
+        # Called on the PortAudio thread with a writable copy of the
+        # captured frame: a numpy int16 array (an int16 memoryview without
+        # numpy). It may edit that in place and return None, or return new
+        # samples as an array or raw int16 bytes.
+        self.on_frame: Optional[Callable] = None
         
         # Device indices (will be detected)
         self.mic_device = None
@@ -42,7 +160,12 @@ class AudioBridge:
     
     def list_devices(self):
         """List all audio devices"""
-        self.pa = pyaudio.PyAudio()
+        if self.pa is None:
+            self.pa = pyaudio.PyAudio()
+        
+        # Each lookup builds a fresh dict in C, so enumerate once
+        self.devices = [self.pa.get_device_info_by_index(i)
+                        for i in range(self.pa.get_device_count())]
         
         print("\n=== Audio Devices ===")
         print("-" * 60)
@@ -50,32 +173,38 @@ class AudioBridge:
         modem_candidates = []
         mic_candidates = []
         speaker_candidates = []
+        lines = []
         
-        for i in range(self.pa.get_device_count()):
-            info = self.pa.get_device_info_by_index(i)
+        for i, info in enumerate(self.devices):
             name = info['name']
             inputs = info['maxInputChannels']
             outputs = info['maxOutputChannels']
             
-            print(f"{i}: {name}")
-            print(f"   Inputs: {inputs}, Outputs: {outputs}")
+            lines.append(f"{i}: {name}")
+            lines.append(f"   Inputs: {inputs}, Outputs: {outputs}")
+            
+            # Nothing to classify on devices that can neither record nor play
+            if not inputs and not outputs:
+                continue
             
             # Detect modem (usually has "SIM" or "Qualcomm" in name)
-            name_lower = name.lower()
-            if 'sim' in name_lower or 'qualcomm' in name_lower or 'modem' in name_lower:
+            if _MODEM_RE.search(name):
                 modem_candidates.append(i)
-                print(f"   ^ Possible MODEM device")
+                lines.append("   ^ Possible MODEM device")
             
             # USB mic
-            if inputs > 0 and ('usb' in name_lower or 'mic' in name_lower):
+            if inputs > 0 and _MIC_RE.search(name):
                 mic_candidates.append(i)
-                print(f"   ^ Possible MICROPHONE")
+                lines.append("   ^ Possible MICROPHONE")
             
             # Pi audio output
-            if outputs > 0 and ('bcm' in name_lower or 'headphone' in name_lower or 
-                               'analog' in name_lower or 'default' in name_lower):
+            if outputs > 0 and _SPK_RE.search(name):
                 speaker_candidates.append(i)
-                print(f"   ^ Possible SPEAKER output")
+                lines.append("   ^ Possible SPEAKER output")
+        
+        # One write for the whole table rather than several per device
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
         
         print("-" * 60)
         
@@ -114,26 +243,20 @@ class AudioBridge:
         if self.pa is None:
             self.pa = pyaudio.PyAudio()
         
-        self.running = True
+        self.running.set()
         
-        # Start mic -> modem thread (your voice to caller)
         if self.modem_device is not None:
-            self.mic_thread = threading.Thread(target=self._mic_to_modem)
-            self.mic_thread.daemon = True
-            self.mic_thread.start()
+            # Mic -> modem (your voice to caller)
+            self._mic_to_modem()
             
-            # Start modem -> speaker thread (caller's voice to you)
-            self.speaker_thread = threading.Thread(target=self._modem_to_speaker)
-            self.speaker_thread.daemon = True
-            self.speaker_thread.start()
+            # Modem -> speaker (caller's voice to you)
+            self._modem_to_speaker()
             
             print("Audio bridge started (Pi <-> Modem)")
         else:
             # No modem device - just do loopback test
             print("No modem device - running mic loopback test")
-            self.loopback_thread = threading.Thread(target=self._mic_loopback)
-            self.loopback_thread.daemon = True
-            self.loopback_thread.start()
+            self._mic_loopback()
         
         return True
     
@@ -160,12 +283,10 @@ class AudioBridge:
         if self.pa is None:
             self.pa = pyaudio.PyAudio()
         
-        self.running = True
+        self.running.set()
         
-        # Only start mic -> modem thread
-        self.mic_thread = threading.Thread(target=self._mic_to_modem)
-        self.mic_thread.daemon = True
-        self.mic_thread.start()
+        # Only start mic -> modem
+        self._mic_to_modem()
         
         print("=" * 50)
         print("HYBRID MODE ACTIVE")
@@ -178,119 +299,190 @@ class AudioBridge:
     
     def stop(self):
         """Stop audio bridging"""
-        self.running = False
-        time.sleep(0.5)
-        
-        if self.mic_stream:
-            self.mic_stream.stop_stream()
-            self.mic_stream.close()
-        if self.speaker_stream:
-            self.speaker_stream.stop_stream()
-            self.speaker_stream.close()
-        if self.modem_in:
-            self.modem_in.stop_stream()
-            self.modem_in.close()
-        if self.modem_out:
-            self.modem_out.stop_stream()
-            self.modem_out.close()
+        self.running.clear()
+        
+        streams = [s for s in (self.mic_stream, self.modem_out,
+                               self.modem_in, self.speaker_stream) if s]
+        self.mic_stream = self.modem_out = None
+        self.modem_in = self.speaker_stream = None
+        
+        # Stop every stream before closing any, so no callback is still
+        # feeding a buffer whose other end has gone. stop_stream() waits for
+        # the in-flight callback to return, so no grace period is needed.
+        for stream in streams:
+            try:
+                stream.stop_stream()
+            except Exception as e:
+                print(f"Error stopping stream: {e}")
+        for stream in streams:
+            try:
+                stream.close()
+            except Exception as e:
+                print(f"Error closing stream: {e}")
+        self._promoted_threads.clear()
         
         if self.pa:
             self.pa.terminate()
+            self.pa = None
         
         print("Audio bridge stopped")
     
-    def _mic_to_modem(self):
-        """Route microphone audio to modem"""
+    def _process_frame(self, in_data: bytes) -> bytes:
+        """Run captured audio through on_frame, if one is set"""
+        hook = self.on_frame
+        if hook is None:
+            return in_data
+        
+        # in_data is immutable, so give the hook its own copy to edit
+        if NUMPY_AVAILABLE:
+            samples = np.frombuffer(in_data, dtype=np.int16).copy()
+        else:
+            samples = memoryview(bytearray(in_data)).cast('h')
+        
+        result = hook(samples)
+        if result is None:
+            result = samples
+        if isinstance(result, (bytes, bytearray)):
+            return bytes(result)
+        return result.tobytes()
+    
+    def _open_bridge(self, in_device: int, out_device: int, process: bool = False):
+        """
+        Open a callback-driven path from in_device to out_device
+        
+        A single full-duplex stream is tried first: its callback hands the
+        captured buffer straight back as output, so there is one PortAudio
+        wakeup per period and no jitter buffer to drift. Devices that
+        cannot be opened together (e.g. on different cards) fall back to a
+        capture/playback pair joined by a PingPongBuffer.
+        
+        PyAudio already requests each device's defaultLow*Latency (the
+        PortAudio "interactive" tier), so the buffer size is the only
+        latency knob left to tune here.
+        
+        Args:
+            in_device: Capture device index
+            out_device: Playback device index
+            process: Pass captured audio through on_frame
+        
+        Returns:
+            (input stream, output stream); the output stream is None when
+            a single duplex stream carries both directions
+        """
+        running = self.running
+        promoted = self._promoted_threads
+        
+        def forward(in_data, frame_count, time_info, status):
+            _promote_audio_thread(promoted)
+            if process:
+                in_data = self._process_frame(in_data)
+            return (in_data, CONTINUE if running.is_set() else COMPLETE)
+        
         try:
-            self.mic_stream = self.pa.open(
+            duplex = self.pa.open(
                 format=FORMAT,
                 channels=CHANNELS,
                 rate=RATE,
                 input=True,
-                input_device_index=self.mic_device,
-                frames_per_buffer=CHUNK
+                output=True,
+                input_device_index=in_device,
+                output_device_index=out_device,
+                frames_per_buffer=self.chunk,
+                stream_callback=forward
             )
-            
-            self.modem_out = self.pa.open(
+            return duplex, None
+        except Exception as e:
+            print(f"Duplex stream unavailable ({e}), using separate streams")
+        
+        frames = PingPongBuffer()
+        
+        def capture(in_data, frame_count, time_info, status):
+            _promote_audio_thread(promoted)
+            if process:
+                in_data = self._process_frame(in_data)
+            frames.write(in_data)
+            return (None, CONTINUE if running.is_set() else COMPLETE)
+        
+        def playback(in_data, frame_count, time_info, status):
+            _promote_audio_thread(promoted)
+            data = frames.read(frame_count * CHANNELS * SAMPLE_WIDTH)
+            return (data, CONTINUE if running.is_set() else COMPLETE)
+        
+        out_stream = self.pa.open(
+            format=FORMAT,
+            channels=CHANNELS,
+            rate=RATE,
+            output=True,
+            output_device_index=out_device,
+            frames_per_buffer=self.chunk,
+            stream_callback=playback
+        )
+        
+        try:
+            in_stream = self.pa.open(
                 format=FORMAT,
                 channels=CHANNELS,
                 rate=RATE,
-                output=True,
-                output_device_index=self.modem_device,
-                frames_per_buffer=CHUNK
+                input=True,
+                input_device_index=in_device,
+                frames_per_buffer=self.chunk,
+                stream_callback=capture
+            )
+        except Exception:
+            out_stream.close()
+            raise
+        
+        return in_stream, out_stream
+    
+    def _mic_to_modem(self):
+        """Route microphone audio to modem"""
+        try:
+            self.mic_stream, self.modem_out = self._open_bridge(
+                self.mic_device, self.modem_device, process=True
             )
-            
             print(f"Mic ({self.mic_device}) -> Modem ({self.modem_device}) started")
-            
-            while self.running:
-                data = self.mic_stream.read(CHUNK, exception_on_overflow=False)
-                self.modem_out.write(data)
-                
         except Exception as e:
             print(f"Mic->Modem error: {e}")
     
     def _modem_to_speaker(self):
         """Route modem audio to speakers"""
         try:
-            self.modem_in = self.pa.open(
-                format=FORMAT,
-                channels=CHANNELS,
-                rate=RATE,
-                input=True,
-                input_device_index=self.modem_device,
-                frames_per_buffer=CHUNK
-            )
-            
-            self.speaker_stream = self.pa.open(
-                format=FORMAT,
-                channels=CHANNELS,
-                rate=RATE,
-                output=True,
-                output_device_index=self.speaker_device,
-                frames_per_buffer=CHUNK
+            self.modem_in, self.speaker_stream = self._open_bridge(
+                self.modem_device, self.speaker_device
             )
-            
             print(f"Modem ({self.modem_device}) -> Speaker ({self.speaker_device}) started")
-            
-            while self.running:
-                data = self.modem_in.read(CHUNK, exception_on_overflow=False)
-                self.speaker_stream.write(data)
-                
         except Exception as e:
             print(f"Modem->Speaker error: {e}")
     
     def _mic_loopback(self):
         """Test mic by playing back to speaker"""
         try:
-            self.mic_stream = self.pa.open(
-                format=FORMAT,
-                channels=CHANNELS,
-                rate=RATE,
-                input=True,
-                input_device_index=self.mic_device,
-                frames_per_buffer=CHUNK
-            )
-            
-            self.speaker_stream = self.pa.open(
-                format=FORMAT,
-                channels=CHANNELS,
-                rate=RATE,
-                output=True,
-                output_device_index=self.speaker_device,
-                frames_per_buffer=CHUNK
+            self.mic_stream, self.speaker_stream = self._open_bridge(
+                self.mic_device, self.speaker_device, process=True
             )
-            
             print(f"Loopback: Mic ({self.mic_device}) -> Speaker ({self.speaker_device})")
             print("Speak into mic - you should hear yourself...")
-            
-            while self.running:
-                data = self.mic_stream.read(CHUNK, exception_on_overflow=False)
-                self.speaker_stream.write(data)
-                
         except Exception as e:
             print(f"Loopback error: {e}")
 
 
+def wait_for_interrupt():
+    """
+    Block until Ctrl+C without waking up periodically
+    
+    The audio runs on PortAudio's threads, so the main thread only has to
+    stay alive; an Event wait sleeps until SIGINT sets it.
+    """
+    done = threading.Event()
+    previous = signal.signal(signal.SIGINT, lambda signum, frame: done.set())
+    try:
+        print("\nPress Ctrl+C to stop...")
+        done.wait()
+        print("\nStopping...")
+    finally:
+        signal.signal(signal.SIGINT, previous)
+
+
 def main():
     print("=" * 60)
     print("SIM7600X Audio Bridge")
@@ -317,9 +509,7 @@ def main():
                 print("  AT+CPCMREG=1")
                 return
             bridge.start()
-            print("\nPress Ctrl+C to stop...")
-            while True:
-                time.sleep(1)
+            wait_for_interrupt()
         
         elif choice == "2":
             # Mic only mode - for hybrid setup
@@ -329,15 +519,11 @@ def main():
                 print("  AT+CPCMREG=1")
                 return
             bridge.start_mic_only()
-            print("\nPress Ctrl+C to stop...")
-            while True:
-                time.sleep(1)
+            wait_for_interrupt()
                 
         elif choice == "3":
             bridge.start()  # Will do loopback if no modem
-            print("\nPress Ctrl+C to stop...")
-            while True:
-                time.sleep(1)
+            wait_for_interrupt()
                 
     except KeyboardInterrupt:
         print("\nStopping...")
@@ -11,6 +11,8 @@ Display: 480x320 touchscreen
 
 import tkinter as tk
 from tkinter import messagebox
+from concurrent.futures import ThreadPoolExecutor
+import glob
 import time
 import sys
 import os
@@ -26,7 +28,7 @@ from ui.gps_screen import GPSScreen
 from ui.diagnostics_screen import DiagnosticsScreen
 
 # Import SIM7600X module
-from sim7600x import SIM7600X, SIM7600XSimulator
+from sim7600x import SIM7600X, SIM7600XSimulator, NetworkStatus
 
 
 class PiPhoneApp:
@@ -96,16 +98,10 @@ class PiPhoneApp:
             except Exception as e:
                 print(f"Failed on {self.serial_port}: {e}")
         
-        # Auto-detect: try common serial ports for the HAT
-        ports = [
-            "/dev/ttyUSB2",  # Most common for SIM7600X HAT
-            "/dev/ttyUSB0",
-            "/dev/ttyUSB1",
-            "/dev/ttyAMA0",
-            "/dev/serial0"
-        ]
-        
-        for port in ports:
+        # Auto-detect: probe every candidate port at once, then connect to
+        # the most likely one that answered
+        port = self._detect_modem_port()
+        if port:
             try:
                 print(f"Trying port: {port}")
                 self.modem = SIM7600X(port=port)
@@ -114,7 +110,6 @@ class PiPhoneApp:
                     return
             except Exception as e:
                 print(f"Failed on {port}: {e}")
-                continue
         
         # No modem found - fall back to simulation mode
         print("No modem found, running in simulation mode")
@@ -122,6 +117,41 @@ class PiPhoneApp:
         self.modem.connect()
         self.simulation_mode = True
     
+    @staticmethod
+    def _candidate_ports() -> list:
+        """List serial ports that could be the HAT, most likely first"""
+        found = set(glob.glob("/dev/ttyUSB*") + glob.glob("/dev/ttyAMA*"))
+        if os.path.exists("/dev/serial0"):
+            found.add("/dev/serial0")
+        
+        # ttyUSB2 is the AT port on the SIM7600X HAT; the rest follow in
+        # the order the old hardcoded list used
+        priority = ["/dev/ttyUSB2", "/dev/ttyUSB0", "/dev/ttyUSB1",
+                    "/dev/ttyAMA0", "/dev/serial0"]
+        ordered = [p for p in priority if p in found]
+        ordered += sorted(found.difference(priority))
+        return ordered
+    
+    def _detect_modem_port(self):
+        """
+        Probe all candidate ports concurrently
+        
+        Returns:
+            The highest-priority port that answered AT, or None
+        """
+        ports = self._candidate_ports()
+        if not ports:
+            return None
+        
+        print(f"Probing ports: {', '.join(ports)}")
+        with ThreadPoolExecutor(max_workers=min(5, len(ports))) as pool:
+            answered = list(pool.map(SIM7600X.probe, ports))
+        
+        for port, ok in zip(ports, answered):
+            if ok:
+                return port
+        return None
+    
     def _create_ui(self):
         """Build the main user interface"""
         # Status bar at top - pack first
@@ -160,14 +190,7 @@ class PiPhoneApp:
         
         # Simulation mode indicator
         if self.simulation_mode:
-            sim_label = tk.Label(
-                self.status_bar,
-                text="SIM",
-                font=Theme.FONT_TINY,
-                bg=self.colors.status_bg,
-                fg=self.colors.accent_warning
-            )
-            sim_label.pack(side=tk.RIGHT, padx=5)
+            self.status_bar.show_simulation()
     
     def _show_screen(self, screen_name: str):
         """Switch to a different screen"""
@@ -180,35 +203,53 @@ class PiPhoneApp:
             self.screens[screen_name].pack(fill=tk.BOTH, expand=True)
     
     def _start_status_updates(self):
-        """Start periodic status bar updates"""
+        """Start status bar updates"""
+        if self.modem:
+            # Signal, registration and GPS changes are pushed by the modem.
+            # Its callbacks run on the monitor thread, so hand them to Tk.
+            self.modem.on_network_update = (
+                lambda info: self.root.after_idle(self._apply_network_info, info)
+            )
+            self.modem.on_gps_update = (
+                lambda gps: self.root.after_idle(self._apply_gps, gps)
+            )
+        
+        self._update_clock()
         self._update_status()
     
-    def _update_status(self):
-        """Update status bar information"""
+    def _update_clock(self):
+        """Update the status bar clock once per minute"""
         # Update time (12-hour format with AM/PM)
         current_time = time.strftime("%I:%M %p").lstrip("0")
         self.status_bar.update_time(current_time)
         
-        # Update from modem
+        # Fire again just after the wall-clock minute rolls over
+        delay = int((60 - time.time() % 60) * 1000) + 50
+        self.root.after(delay, self._update_clock)
+    
+    def _update_status(self):
+        """Poll the modem as a fallback for missed unsolicited updates"""
         if self.modem and self.modem.connected:
-            # Signal strength
-            signal = self.modem.get_signal_strength()
-            self.status_bar.update_signal(signal)
-            
-            # Operator
-            info = self.modem.get_network_info()
-            self.status_bar.update_operator(info.get('operator', ''))
-            
-            # GPS status
-            gps = self.modem.gps_data
-            self.status_bar.update_gps(
-                active=hasattr(self.screens.get('gps'), 'gps_active') and 
-                       self.screens['gps'].gps_active,
-                has_fix=gps.fix_status if gps else False
-            )
+            # One modem round-trip for signal, operator and GPS
+            snap = self.modem.get_status_snapshot()
+            self._apply_network_info(snap)
+            self._apply_gps(snap.gps)
         
-        # Schedule next update (every 5 seconds)
-        self.root.after(5000, self._update_status)
+        # Schedule next poll (every 60 seconds)
+        self.root.after(60000, self._update_status)
+    
+    def _apply_network_info(self, info: NetworkStatus):
+        """Show signal strength and operator from a network update"""
+        self.status_bar.update_signal(info.signal)
+        self.status_bar.update_operator(info.operator)
+    
+    def _apply_gps(self, gps):
+        """Show GPS power and fix state from a GPS update"""
+        gps_screen = self.screens.get('gps')
+        self.status_bar.update_gps(
+            active=getattr(gps_screen, 'gps_active', False),
+            has_fix=gps.fix_status if gps else False
+        )
     
     def run(self):
         """Start the application main loop"""
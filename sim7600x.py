@@ -5,12 +5,15 @@ Handles phone calls, SMS, and GPS functionality via AT commands
 For Waveshare SIM7600X 4G HAT on Raspberry Pi 3+
 """
 
+import os
+import random
+import select
+import sys
 import time
 import threading
-import queue
 import re
-from typing import Optional, Callable, List, Dict, Tuple
-from dataclasses import dataclass
+from typing import Optional, Callable, List, Dict, Tuple, Union
+from dataclasses import dataclass, fields
 from enum import Enum
 
 # Try to import serial, gracefully handle if not available
@@ -22,6 +25,67 @@ except ImportError:
     SERIAL_AVAILABLE = False
     print("Warning: pyserial not installed. Hardware modem support disabled.")
 
+# termios is POSIX-only; without it, port probing goes through pyserial
+try:
+    import termios
+except ImportError:
+    termios = None
+
+# AT response patterns, compiled once at import
+
+# Network status
+_CREG_RE = re.compile(r'\+CREG:\s*\d+,(\d+)')
+_CREG_URC_RE = re.compile(r'^\+CREG:\s*(\d+)\s*$')
+_CSQ_RE = re.compile(r'\+CSQ:\s*(\d+),')
+_COPS_RE = re.compile(r'\+COPS:\s*\d+,\d+,"([^"]*)"')
+_CGDCONT_RE = re.compile(r'\+CGDCONT:\s*1,"[^"]*","([^"]*)"')
+
+# Calls and SMS
+_CLIP_RE = re.compile(r'\+CLIP:\s*"([^"]*)"')
+_CMTI_RE = re.compile(r'\+CMTI:\s*"[^"]*",(\d+)')
+_CMT_RE = re.compile(r'\+CMT:\s*"([^"]*)","[^"]*","([^"]*)"')
+_CMGR_HEADER_RE = re.compile(r'\+CMGR:\s*"([^"]*)","([^"]*)","[^"]*","([^"]*)"')
+_CMGL_HEADER_RE = re.compile(r'\+CMGL:\s*(\d+),"([^"]*)","([^"]*)","[^"]*","([^"]*)"')
+
+# GPS
+_SATELLITES_RE = re.compile(r'(\d+)\s*satellites', re.I)
+
+# Frequently sent commands, encoded and terminated once at import
+_CMD_AT = b"AT\r\n"
+_CMD_ANSWER = b"ATA\r\n"
+_CMD_HANGUP = b"ATH\r\n"
+_CMD_NETWORK_STATUS = b"AT+CREG?;+CSQ;+COPS?\r\n"
+_CMD_SELF_TEST = b"AT+CPIN?;+CREG?;+CSQ;+COPS?;+CGPS?\r\n"
+_CMD_GPS_POWER = b"AT+CGPS?\r\n"
+_CMD_GPS_INFO = b"AT+CGPSINFO\r\n"
+_CMD_GPS_STATUS = b"AT+CGPSSTATUS?\r\n"
+_CMD_GPS_SATELLITES = b"AT+CGPSSTATUS?;+CGPSINF=32\r\n"
+
+
+def _nmea_to_deg(nmea: float, negative: bool) -> float:
+    """Convert an NMEA DDMM.MMMM (or DDDMM.MMMM) value to decimal degrees"""
+    degrees, minutes = divmod(nmea, 100.0)
+    value = degrees + minutes / 60.0
+    return -value if negative else value
+
+
+class _KeepOnly(dict):
+    """str.translate table that deletes every character not listed"""
+    
+    def __init__(self, keep: str):
+        super().__init__((ord(c), c) for c in keep)
+    
+    def __missing__(self, key):
+        return None
+
+
+# Characters kept when cleaning a number to dial or to text
+_DIAL_CHARS = _KeepOnly("0123456789+*#")
+_SMS_NUM_CHARS = _KeepOnly("0123456789+")
+
+# __slots__ for dataclasses needs Python 3.10+; older versions keep __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class CallState(Enum):
     IDLE = "idle"
@@ -32,7 +96,7 @@ class CallState(Enum):
     HELD = "held"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GPSData:
     """GPS position data"""
     latitude: float = 0.0
@@ -47,18 +111,7 @@ class GPSData:
     fix_type: int = 0  # 0=no fix, 1=GPS, 2=DGPS, 3=PPS, etc.
     
     def to_dict(self) -> dict:
-        return {
-            'latitude': self.latitude,
-            'longitude': self.longitude,
-            'altitude': self.altitude,
-            'speed': self.speed,
-            'course': self.course,
-            'timestamp': self.timestamp,
-            'satellites': self.satellites,
-            'fix_status': self.fix_status,
-            'hdop': self.hdop,
-            'fix_type': self.fix_type
-        }
+        return {name: getattr(self, name) for name in _GPS_FIELDS}
     
     @property
     def accuracy_meters(self) -> float:
@@ -68,7 +121,19 @@ class GPSData:
         return 0.0
 
 
-@dataclass
+_GPS_FIELDS = tuple(f.name for f in fields(GPSData))
+
+
+@dataclass(frozen=True, **_SLOTS)
+class NetworkStatus:
+    """Network state as shown in the status bar"""
+    registered: bool = False
+    operator: str = ""
+    signal: int = 0  # 0-100
+    gps: Optional[GPSData] = None
+
+
+@dataclass(**_SLOTS)
 class SMSMessage:
     """SMS message data"""
     index: int
@@ -89,6 +154,9 @@ class SIM7600X:
     - Network status and signal strength
     """
     
+    # Seconds a network status query stays fresh
+    NETWORK_STATUS_TTL = 1.5
+    
     def __init__(self, port: str = "/dev/ttyUSB2", baudrate: int = 115200):
         """
         Initialize SIM7600X connection
@@ -109,17 +177,21 @@ class SIM7600X:
         self.signal_strength = 0
         self.network_registered = False
         self.operator_name = ""
+        self._network_status_time = float("-inf")
         
         # Callbacks for events
         self.on_incoming_call: Optional[Callable[[str], None]] = None
         self.on_call_ended: Optional[Callable[[], None]] = None
         self.on_sms_received: Optional[Callable[[SMSMessage], None]] = None
         self.on_gps_update: Optional[Callable[[GPSData], None]] = None
+        self.on_network_update: Optional[Callable[[NetworkStatus], None]] = None
+        
+        # Whether the firmware accepts AT+CGPSINF (GGA on the AT port)
+        self._gps_inf_supported = True
         
         # Background monitoring
         self._monitor_thread: Optional[threading.Thread] = None
         self._stop_monitor = threading.Event()
-        self._response_queue = queue.Queue()
         self._lock = threading.Lock()
         
     def connect(self) -> bool:
@@ -136,10 +208,18 @@ class SIM7600X:
                 timeout=1,
                 write_timeout=1
             )
+            
+            # Have the USB-serial driver push each packet immediately instead
+            # of on its ~16 ms flush timer (Linux ASYNC_LOW_LATENCY)
+            try:
+                self.serial.set_low_latency_mode(True)
+            except (AttributeError, NotImplementedError, OSError, ValueError):
+                pass  # Not Linux, or the driver does not support it
+            
             time.sleep(0.5)
             
             # Test connection with AT command
-            response = self._send_at_command("AT")
+            response = self._send_at_command(_CMD_AT)
             if "OK" in response:
                 self.connected = True
                 self._initialize_module()
@@ -156,6 +236,82 @@ class SIM7600X:
             self.connected = False
             return False
     
+    @staticmethod
+    def probe(port: str, baudrate: int = 115200, timeout: float = 0.5) -> bool:
+        """
+        Check whether an AT-speaking modem answers on a port
+        
+        Cheap enough to run on every candidate port in parallel: opens the
+        port non-blocking (so a dead line's modem-control signals cannot
+        stall the open), sends a bare AT and waits at most timeout for OK,
+        without the initialization that connect() performs.
+        
+        Args:
+            port: Serial port to probe
+            baudrate: Communication speed
+            timeout: Seconds to wait for OK
+            
+        Returns:
+            True if the port answered OK
+        """
+        if termios is None:
+            return SIM7600X._probe_serial(port, baudrate, timeout)
+        
+        try:
+            fd = os.open(port, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+        except OSError:
+            return False
+        
+        try:
+            # Raw 8N1, ignoring modem-control lines
+            attrs = termios.tcgetattr(fd)
+            attrs[0] = 0  # iflag
+            attrs[1] = 0  # oflag
+            attrs[2] = termios.CS8 | termios.CREAD | termios.CLOCAL
+            attrs[3] = 0  # lflag
+            attrs[4] = attrs[5] = getattr(termios, f"B{baudrate}")
+            attrs[6][termios.VMIN] = 0
+            attrs[6][termios.VTIME] = 0
+            termios.tcsetattr(fd, termios.TCSANOW, attrs)
+            termios.tcflush(fd, termios.TCIFLUSH)
+            
+            os.write(fd, b"AT\r")
+            response = b""
+            deadline = time.monotonic() + timeout
+            while b"OK" not in response:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                readable, _, _ = select.select([fd], [], [], remaining)
+                if readable:
+                    response += os.read(fd, 256)
+            return True
+        except (OSError, AttributeError, termios.error):
+            return False
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def _probe_serial(port: str, baudrate: int, timeout: float) -> bool:
+        """probe() through pyserial, for platforms without termios"""
+        if not SERIAL_AVAILABLE:
+            return False
+        
+        try:
+            with serial.Serial(port=port, baudrate=baudrate,
+                               timeout=0.25, write_timeout=0.25) as ser:
+                ser.reset_input_buffer()
+                ser.write(b"AT\r")
+                response = b""
+                deadline = time.monotonic() + timeout
+                while time.monotonic() < deadline:
+                    response += ser.read(ser.in_waiting or 1)
+                    if b"OK" in response:
+                        return True
+        except (serial.SerialException, OSError):
+            pass
+        return False
+    
     def disconnect(self):
         """Close connection to module"""
         self._stop_monitor.set()
@@ -189,6 +345,11 @@ class SIM7600X:
         # Enable caller ID
         self._send_at_command("AT+CLIP=1")
         
+        # Have the module push registration and signal changes
+        # (+CREG: <stat> and +CSQ: <rssi>,<ber>) instead of being polled
+        self._send_at_command("AT+CREG=1")
+        self._send_at_command("AT+AUTOCSQ=1,1")
+        
         # Configure audio for calls
         self._setup_audio()
         
@@ -209,7 +370,7 @@ class SIM7600X:
         time.sleep(5)
         
         # Get initial network status
-        self._update_network_status()
+        self._update_network_status(force=True)
         
         if self.network_registered:
             print(f"Successfully registered on: {self.operator_name}")
@@ -265,26 +426,27 @@ class SIM7600X:
     def set_volume(self, level: int) -> bool:
         """Set speaker volume (0-5)"""
         level = max(0, min(5, level))
-        response = self._send_at_command(f"AT+CLVL={level}")
+        response = self._send_at_command(b"AT+CLVL=%d\r\n" % level)
         return "OK" in response
     
     def set_mic_gain(self, gain: int) -> bool:
         """Set microphone gain (0-15)"""
         gain = max(0, min(15, gain))
-        response = self._send_at_command(f"AT+CMIC=0,{gain}")
+        response = self._send_at_command(b"AT+CMIC=0,%d\r\n" % gain)
         return "OK" in response
     
     def mute_mic(self, mute: bool = True) -> bool:
         """Mute or unmute microphone"""
-        response = self._send_at_command(f"AT+CMUT={1 if mute else 0}")
+        response = self._send_at_command(b"AT+CMUT=1\r\n" if mute else b"AT+CMUT=0\r\n")
         return "OK" in response
     
-    def _send_at_command(self, command: str, timeout: float = 2.0) -> str:
+    def _send_at_command(self, command: Union[str, bytes], timeout: float = 2.0) -> str:
         """
         Send AT command and wait for response
         
         Args:
-            command: AT command string
+            command: AT command string, or an already encoded command
+                     including its trailing CR LF
             timeout: Response timeout in seconds
             
         Returns:
@@ -293,33 +455,88 @@ class SIM7600X:
         if not self.serial or not self.serial.is_open:
             return "ERROR: Not connected"
         
-        with self._lock:
-            try:
-                # Clear any pending data
-                self.serial.reset_input_buffer()
+        pending = None
+        try:
+            with self._lock:
+                # Anything already waiting is an unsolicited result the
+                # monitor hasn't picked up yet; keep it rather than flush it
+                if self.serial.in_waiting:
+                    pending = self.serial.read(self.serial.in_waiting)
                 
                 # Send command
-                cmd = f"{command}\r\n"
-                self.serial.write(cmd.encode())
+                if isinstance(command, str):
+                    command = f"{command}\r\n".encode()
+                self.serial.write(command)
                 
                 # Wait for response
-                response = ""
-                start_time = time.time()
-                
-                while time.time() - start_time < timeout:
-                    if self.serial.in_waiting:
-                        data = self.serial.read(self.serial.in_waiting)
-                        response += data.decode('utf-8', errors='ignore')
-                        
-                        # Check for command completion
-                        if "OK" in response or "ERROR" in response or ">" in response:
-                            break
-                    time.sleep(0.05)
+                response = self._read_response(timeout)
                 
-                return response.strip()
-                
-            except Exception as e:
-                return f"ERROR: {e}"
+            return response.strip()
+            
+        except Exception as e:
+            return f"ERROR: {e}"
+        
+        finally:
+            # Outside the lock, since handlers may send AT commands
+            if pending:
+                try:
+                    self._process_unsolicited(pending.decode('utf-8', errors='ignore'))
+                except Exception:
+                    pass
+    
+    def _read_response(self, timeout: float,
+                       terminators: Tuple[bytes, ...] = (b"OK", b"ERROR", b">")) -> str:
+        """
+        Read from the module until a terminator arrives or timeout expires
+        
+        Blocks in the kernel until bytes arrive rather than sleeping between
+        in_waiting checks, so a reply is picked up as soon as it lands.
+        The reply is collected as raw bytes and decoded once at the end.
+        
+        Args:
+            timeout: Seconds to wait in total
+            terminators: Byte strings that mark the response as complete
+            
+        Returns:
+            Everything read, possibly partial on timeout
+        """
+        response = bytearray()
+        overlap = max(len(t) for t in terminators) - 1
+        deadline = time.monotonic() + timeout
+        
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._wait_readable(remaining):
+                break
+            # Only the new bytes (plus enough to catch a split terminator)
+            # need scanning for completion
+            start = max(0, len(response) - overlap)
+            response += self.serial.read(self.serial.in_waiting or 1)
+            
+            # Check for command completion
+            if any(response.find(t, start) >= 0 for t in terminators):
+                break
+        
+        return response.decode('utf-8', errors='ignore')
+    
+    def _wait_readable(self, timeout: float) -> bool:
+        """Block until the serial port has data or timeout expires"""
+        try:
+            fd = self.serial.fileno()
+        except (AttributeError, OSError):
+            fd = None
+        
+        if fd is not None:
+            readable, _, _ = select.select([fd], [], [], timeout)
+            return bool(readable) or self.serial.in_waiting > 0
+        
+        # No pollable descriptor (e.g. Windows): fall back to short polls
+        deadline = time.monotonic() + timeout
+        while not self.serial.in_waiting:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
     
     def _start_monitor(self):
         """Start background thread for monitoring incoming events"""
@@ -331,14 +548,21 @@ class SIM7600X:
         """Background loop for monitoring unsolicited responses"""
         while not self._stop_monitor.is_set():
             try:
-                if self.serial and self.serial.in_waiting:
+                data = None
+                # Sleep in select until the modem sends something; the
+                # timeout only bounds how long a stop request can take
+                if self.serial and self._wait_readable(0.5):
+                    # Hold the lock only for the read itself; parsing and
+                    # callbacks (which may send AT commands, e.g. read_sms
+                    # on +CMTI) run after it is released
                     with self._lock:
-                        data = self.serial.read(self.serial.in_waiting)
-                        text = data.decode('utf-8', errors='ignore')
-                        self._process_unsolicited(text)
+                        if self.serial.in_waiting:
+                            data = self.serial.read(self.serial.in_waiting)
+                if data:
+                    self._process_unsolicited(data.decode('utf-8', errors='ignore'))
             except Exception:
-                pass
-            time.sleep(0.1)
+                # Don't spin if the port has gone away
+                self._stop_monitor.wait(0.1)
     
     def _process_unsolicited(self, data: str):
         """Process unsolicited responses from module"""
@@ -348,9 +572,16 @@ class SIM7600X:
         while i < len(lines):
             line = lines[i].strip()
             
+            # Most lines (OK, blanks, echoes) are not URCs; reject them on
+            # the first character before any prefix or regex test
+            first = line[:1]
+            if first != "+" and first != "N" and first != "B":
+                i += 1
+                continue
+            
             # Incoming call notification
-            if "+CLIP:" in line:
-                match = re.search(r'\+CLIP:\s*"([^"]*)"', line)
+            if line.startswith("+CLIP:"):
+                match = _CLIP_RE.search(line)
                 if match:
                     number = match.group(1)
                     self.call_state = CallState.INCOMING
@@ -359,15 +590,31 @@ class SIM7600X:
                         self.on_incoming_call(number)
             
             # Call ended
-            elif "NO CARRIER" in line or "BUSY" in line:
+            elif line.startswith(("NO CARRIER", "BUSY")):
                 self.call_state = CallState.IDLE
                 self.current_call_number = ""
                 if self.on_call_ended:
                     self.on_call_ended()
             
+            # Signal quality change (AT+AUTOCSQ)
+            elif line.startswith("+CSQ:"):
+                match = _CSQ_RE.search(line)
+                if match:
+                    self.signal_strength = self._rssi_to_percent(int(match.group(1)))
+                    self._notify_network()
+            
+            # Registration change (AT+CREG=1)
+            elif line.startswith("+CREG:"):
+                # The URC carries only <stat>; a late solicited answer
+                # is "<n>,<stat>" and must be read from the second field
+                match = _CREG_URC_RE.search(line) or _CREG_RE.search(line)
+                if match:
+                    self.network_registered = int(match.group(1)) in [1, 5]
+                    self._notify_network()
+            
             # New SMS notification (stored, need to read)
-            elif "+CMTI:" in line:
-                match = re.search(r'\+CMTI:\s*"[^"]*",(\d+)', line)
+            elif line.startswith("+CMTI:"):
+                match = _CMTI_RE.search(line)
                 if match:
                     index = int(match.group(1))
                     sms = self.read_sms(index)
@@ -376,8 +623,8 @@ class SIM7600X:
             
             # Direct SMS notification (content included)
             # Format: +CMT: "sender","","timestamp"\r\nmessage content
-            elif "+CMT:" in line:
-                match = re.search(r'\+CMT:\s*"([^"]*)","[^"]*","([^"]*)"', line)
+            elif line.startswith("+CMT:"):
+                match = _CMT_RE.search(line)
                 if match:
                     sender = match.group(1)
                     timestamp = match.group(2)
@@ -415,7 +662,7 @@ class SIM7600X:
             True if dialing started successfully
         """
         # Clean number
-        number = re.sub(r'[^\d+*#]', '', number)
+        number = number.translate(_DIAL_CHARS)
         
         response = self._send_at_command(f"ATD{number};", timeout=10)
         
@@ -427,7 +674,7 @@ class SIM7600X:
     
     def answer(self) -> bool:
         """Answer incoming call"""
-        response = self._send_at_command("ATA", timeout=5)
+        response = self._send_at_command(_CMD_ANSWER, timeout=5)
         if "OK" in response or "CONNECT" in response:
             self.call_state = CallState.ACTIVE
             return True
@@ -435,7 +682,7 @@ class SIM7600X:
     
     def hangup(self) -> bool:
         """End current call"""
-        response = self._send_at_command("ATH", timeout=5)
+        response = self._send_at_command(_CMD_HANGUP, timeout=5)
         if "OK" in response:
             self.call_state = CallState.IDLE
             self.current_call_number = ""
@@ -465,7 +712,7 @@ class SIM7600X:
             True if sent successfully
         """
         # Clean number
-        number = re.sub(r'[^\d+]', '', number)
+        number = number.translate(_SMS_NUM_CHARS)
         
         # Set text mode
         self._send_at_command("AT+CMGF=1")
@@ -474,20 +721,14 @@ class SIM7600X:
         response = self._send_at_command(f'AT+CMGS="{number}"', timeout=5)
         
         if ">" in response:
-            # Send message content with Ctrl+Z to finish
-            self.serial.write(message.encode())
-            self.serial.write(bytes([26]))  # Ctrl+Z
-            
-            # Wait for send confirmation
-            time.sleep(3)
-            response = ""
-            start = time.time()
-            while time.time() - start < 10:
-                if self.serial.in_waiting:
-                    response += self.serial.read(self.serial.in_waiting).decode('utf-8', errors='ignore')
-                    if "+CMGS:" in response or "ERROR" in response:
-                        break
-                time.sleep(0.1)
+            # Held so the monitor thread cannot swallow the confirmation
+            with self._lock:
+                # Send message content with Ctrl+Z to finish
+                self.serial.write(message.encode() + b"\x1a")
+                
+                # Wait for send confirmation (+CMGS: <mr> then OK); returns
+                # as soon as the network acknowledges the message
+                response = self._read_response(13, (b"OK", b"ERROR"))
             
             return "+CMGS:" in response
         
@@ -503,23 +744,29 @@ class SIM7600X:
         Returns:
             SMSMessage object or None
         """
-        response = self._send_at_command(f"AT+CMGR={index}", timeout=3)
-        
-        # Parse response
-        match = re.search(
-            r'\+CMGR:\s*"([^"]*)","([^"]*)","[^"]*","([^"]*)".*?\r\n(.+)',
-            response, re.DOTALL
+        response = self._send_at_command(b"AT+CMGR=%d\r\n" % index, timeout=3)
+        
+        # Parse response: the +CMGR header line, then the body lines up to
+        # the final OK
+        lines = response.splitlines()
+        for i, line in enumerate(lines):
+            header = _CMGR_HEADER_RE.match(line)
+            if header:
+                break
+        else:
+            return None
+        
+        body = lines[i + 1:]
+        if body and body[-1] == "OK":
+            body.pop()
+        
+        return SMSMessage(
+            index=index,
+            status=header.group(1),
+            sender=header.group(2),
+            timestamp=header.group(3),
+            content="\n".join(body).strip()
         )
-        
-        if match:
-            return SMSMessage(
-                index=index,
-                status=match.group(1),
-                sender=match.group(2),
-                timestamp=match.group(3),
-                content=match.group(4).strip().replace('\r\n', '\n')
-            )
-        return None
     
     def list_sms(self, status: str = "ALL") -> List[SMSMessage]:
         """
@@ -534,24 +781,36 @@ class SIM7600X:
         messages = []
         response = self._send_at_command(f'AT+CMGL="{status}"', timeout=10)
         
-        # Parse each message
-        pattern = r'\+CMGL:\s*(\d+),"([^"]*)","([^"]*)","[^"]*","([^"]*)".*?\r\n([^\+]+)'
-        matches = re.findall(pattern, response, re.DOTALL)
-        
-        for match in matches:
+        # Parse each message: a +CMGL header line followed by its body
+        # lines, up to the next header or the final OK
+        lines = response.splitlines()
+        i = 0
+        while i < len(lines):
+            header = _CMGL_HEADER_RE.match(lines[i])
+            i += 1
+            if not header:
+                continue
+            
+            body = []
+            while i < len(lines) and not lines[i].startswith("+CMGL:"):
+                body.append(lines[i])
+                i += 1
+            if body and body[-1] == "OK":
+                body.pop()
+            
             messages.append(SMSMessage(
-                index=int(match[0]),
-                status=match[1],
-                sender=match[2],
-                timestamp=match[3],
-                content=match[4].strip()
+                index=int(header.group(1)),
+                status=header.group(2),
+                sender=header.group(3),
+                timestamp=header.group(4),
+                content="\n".join(body).strip()
             ))
         
         return messages
     
     def delete_sms(self, index: int) -> bool:
         """Delete SMS by index"""
-        response = self._send_at_command(f"AT+CMGD={index}")
+        response = self._send_at_command(b"AT+CMGD=%d\r\n" % index)
         return "OK" in response
     
     def delete_all_sms(self) -> bool:
@@ -564,22 +823,29 @@ class SIM7600X:
     def gps_power_on(self) -> bool:
         """Enable GPS module"""
         # First check if already on
-        status = self._send_at_command("AT+CGPS?", timeout=3)
+        status = self._send_at_command(_CMD_GPS_POWER, timeout=3)
         if "+CGPS: 1" in status:
-            return True
-        
-        # Turn on GPS with mode 1 (standalone)
-        response = self._send_at_command("AT+CGPS=1,1", timeout=5)
-        if "OK" in response:
-            # Give GPS time to initialize
-            time.sleep(2)
-            return True
-        return False
+            powered = True
+        else:
+            # Turn on GPS with mode 1 (standalone)
+            response = self._send_at_command("AT+CGPS=1,1", timeout=5)
+            powered = "OK" in response
+            if powered:
+                # Enable NMEA sentence output (GGA carries satellites/HDOP)
+                self._send_at_command("AT+CGPSINFOCFG=1,31", timeout=2)
+                # Give GPS time to initialize
+                time.sleep(2)
+        
+        if powered and self.on_gps_update:
+            self.on_gps_update(self.gps_data)
+        return powered
     
     def gps_power_off(self) -> bool:
         """Disable GPS module"""
         response = self._send_at_command("AT+CGPS=0", timeout=5)
         self.gps_data.fix_status = False
+        if self.on_gps_update:
+            self.on_gps_update(self.gps_data)
         return "OK" in response
     
     def get_gps_position(self) -> GPSData:
@@ -590,43 +856,25 @@ class SIM7600X:
             GPSData object with current position
         """
         # Get GPS info
-        response = self._send_at_command("AT+CGPSINFO", timeout=5)
+        response = self._send_at_command(_CMD_GPS_INFO, timeout=5)
         
         # Parse GPS info
-        # Format: +CGPSINFO: lat,N/S,lon,E/W,date,UTC time,altitude,speed,course
-        # Example: +CGPSINFO: 3749.048467,N,12224.895475,W,100624,175032.0,10.1,0.0,0.0
-        match = re.search(
-            r'\+CGPSINFO:\s*(\d+\.?\d*),([NS]),(\d+\.?\d*),([EW]),(\d+),(\d+\.?\d*),(\d+\.?\d*),(\d+\.?\d*),(\d+\.?\d*)',
-            response
-        )
+        fix = self._parse_cgpsinfo(response)
         
-        if match:
-            # Convert NMEA coordinates to decimal degrees
-            lat_nmea = float(match.group(1))
-            lat_dir = match.group(2)
-            lon_nmea = float(match.group(3))
-            lon_dir = match.group(4)
+        if fix:
+            lat_nmea, lat_dir, lon_nmea, lon_dir, date, utc, altitude, speed, course = fix
             
             # NMEA format: DDMM.MMMM -> convert to decimal
-            lat_deg = int(lat_nmea / 100)
-            lat_min = lat_nmea - (lat_deg * 100)
-            latitude = lat_deg + (lat_min / 60)
-            if lat_dir == 'S':
-                latitude = -latitude
-            
-            lon_deg = int(lon_nmea / 100)
-            lon_min = lon_nmea - (lon_deg * 100)
-            longitude = lon_deg + (lon_min / 60)
-            if lon_dir == 'W':
-                longitude = -longitude
+            latitude = _nmea_to_deg(lat_nmea, lat_dir == 'S')
+            longitude = _nmea_to_deg(lon_nmea, lon_dir == 'W')
             
             self.gps_data = GPSData(
                 latitude=latitude,
                 longitude=longitude,
-                altitude=float(match.group(7)),
-                speed=float(match.group(8)),
-                course=float(match.group(9)),
-                timestamp=f"{match.group(5)} {match.group(6)}",
+                altitude=altitude,
+                speed=speed,
+                course=course,
+                timestamp=f"{date} {utc}",
                 fix_status=True
             )
             
@@ -646,11 +894,75 @@ class SIM7600X:
         
         return self.gps_data
     
+    @staticmethod
+    def _parse_cgpsinfo(response: str) -> Optional[tuple]:
+        """
+        Split a +CGPSINFO response into its fields
+        
+        Format: +CGPSINFO: lat,N/S,lon,E/W,date,UTC time,altitude,speed,course
+        Example: +CGPSINFO: 3749.048467,N,12224.895475,W,100624,175032.0,10.1,0.0,0.0
+        
+        Returns:
+            (lat, N/S, lon, E/W, date, time, altitude, speed, course) with
+            the numeric fields as floats, or None if there is no fix
+        """
+        start = response.find("+CGPSINFO:")
+        if start < 0:
+            return None
+        payload = response[start + 10:].split("\r", 1)[0].split("\n", 1)[0]
+        fields = [f.strip() for f in payload.split(",")]
+        
+        # +CGPSINFO: ,,,,,,,, means GPS on but no fix
+        if len(fields) < 9 or not fields[0]:
+            return None
+        if fields[1] not in ("N", "S") or fields[3] not in ("E", "W"):
+            return None
+        try:
+            return (float(fields[0]), fields[1], float(fields[2]), fields[3],
+                    fields[4], fields[5],
+                    float(fields[6]), float(fields[7]), float(fields[8]))
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def _parse_gga(text: str) -> Optional[Tuple[int, float]]:
+        """
+        Find a GGA sentence and return (satellites, hdop)
+        
+        $GPGGA,hhmmss.ss,lat,N,lon,W,qual,numSats,hdop,alt,M,height,M,dgpsTime,dgpsId*checksum
+        """
+        # Only a sentence at the start of its own line counts; stop at the
+        # first one rather than scanning the rest of a long NMEA dump
+        for line in text.splitlines():
+            if line.startswith(("$GPGGA,", "$GNGGA,")):
+                break
+        else:
+            return None
+        fields = line.split(",", 9)
+        if len(fields) < 9 or not fields[7].isdigit():
+            return None
+        try:
+            hdop = float(fields[8])
+        except ValueError:
+            hdop = 0.0
+        return int(fields[7]), hdop
+    
     def _update_gps_satellites(self):
         """Update satellite count and accuracy info"""
-        # Method 1: Try AT+CGPSSTATUS? for fix status
-        response = self._send_at_command("AT+CGPSSTATUS?", timeout=3)
-        # Response like: +CGPSSTATUS: Location 3D Fix
+        # Fix status and NMEA GGA in one round-trip; the +CGPSINFO position
+        # was already read by get_gps_position. Firmware without CGPSINF
+        # answers ERROR for it, sometimes after the CGPSSTATUS line and
+        # sometimes instead of it; either way drop it from then on.
+        response = ""
+        if self._gps_inf_supported:
+            response = self._send_at_command(_CMD_GPS_SATELLITES, timeout=3)
+            if ("ERROR" in response and "+CGPSINF" not in response
+                    and "GGA," not in response):
+                self._gps_inf_supported = False
+        if not self._gps_inf_supported and "+CGPSSTATUS" not in response:
+            response = self._send_at_command(_CMD_GPS_STATUS, timeout=3)
+        
+        # Fix type, response like: +CGPSSTATUS: Location 3D Fix
         if "3D Fix" in response:
             self.gps_data.fix_type = 3
         elif "2D Fix" in response:
@@ -658,32 +970,14 @@ class SIM7600X:
         elif "Location Not Fix" in response or "Location Unknown" in response:
             self.gps_data.fix_type = 0
         
-        # Method 2: Get NMEA GGA sentence for satellite count and HDOP
-        response = self._send_at_command("AT+CGPSINFOCFG=1,31", timeout=2)  # Enable GGA output
-        time.sleep(0.5)
-        
-        # Read NMEA data
-        nmea_response = self._send_at_command("AT+CGPSINFO", timeout=3)
-        
-        # Try to parse satellite count from GSV or use GPSINF
-        sat_response = self._send_at_command("AT+CGPSINF=32", timeout=3)
+        # Satellite count and HDOP from the NMEA GGA sentence, if present
+        gga = self._parse_gga(response)
         
-        # Parse NMEA GGA if available
-        # $GPGGA,hhmmss.ss,lat,N,lon,W,qual,numSats,hdop,alt,M,height,M,dgpsTime,dgpsId*checksum
-        gga_match = re.search(
-            r'\$G[PN]GGA,[\d.]*,[\d.]*,[NS],[\d.]*,[EW],\d,(\d+),([\d.]*),',
-            nmea_response + sat_response
-        )
-        
-        if gga_match:
-            self.gps_data.satellites = int(gga_match.group(1))
-            try:
-                self.gps_data.hdop = float(gga_match.group(2))
-            except:
-                self.gps_data.hdop = 0.0
+        if gga:
+            self.gps_data.satellites, self.gps_data.hdop = gga
         else:
             # Fallback: try basic satellite query
-            sat_match = re.search(r'(\d+)\s*satellites', response.lower())
+            sat_match = _SATELLITES_RE.search(response)
             if sat_match:
                 self.gps_data.satellites = int(sat_match.group(1))
     
@@ -704,12 +998,12 @@ class SIM7600X:
         }
         
         # Check if GPS is powered
-        response = self._send_at_command("AT+CGPS?", timeout=3)
+        response = self._send_at_command(_CMD_GPS_POWER, timeout=3)
         if "+CGPS: 1" in response:
             status['powered'] = True
         
         # Get fix status
-        response = self._send_at_command("AT+CGPSSTATUS?", timeout=3)
+        response = self._send_at_command(_CMD_GPS_STATUS, timeout=3)
         if "3D Fix" in response:
             status['fix'] = True
             status['fix_type'] = 3
@@ -725,32 +1019,59 @@ class SIM7600X:
     
     # ==================== NETWORK FUNCTIONS ====================
     
-    def _update_network_status(self):
-        """Update network registration and signal info"""
+    def _update_network_status(self, force: bool = False):
+        """
+        Update network registration and signal info
+        
+        Results younger than NETWORK_STATUS_TTL are reused, so callers
+        asking for signal and network info back to back share one query.
+        
+        Args:
+            force: Query the module even if the cached values are fresh
+        """
+        now = time.monotonic()
+        if not force and now - self._network_status_time < self.NETWORK_STATUS_TTL:
+            return
+        self._network_status_time = now
+        
+        # One compound command: registration, signal and operator all come
+        # back in a single response instead of three serial round-trips
+        self._parse_network_status(self._send_at_command(_CMD_NETWORK_STATUS))
+    
+    def _parse_network_status(self, response: str):
+        """Apply any +CREG, +CSQ and +COPS results found in a response"""
         # Check registration
-        response = self._send_at_command("AT+CREG?")
-        match = re.search(r'\+CREG:\s*\d+,(\d+)', response)
+        match = _CREG_RE.search(response)
         if match:
             status = int(match.group(1))
             self.network_registered = status in [1, 5]  # Home or roaming
         
         # Get signal strength
-        response = self._send_at_command("AT+CSQ")
-        match = re.search(r'\+CSQ:\s*(\d+),', response)
+        match = _CSQ_RE.search(response)
         if match:
-            rssi = int(match.group(1))
-            # Convert RSSI to percentage (0-31 scale, 99=unknown)
-            if rssi != 99:
-                self.signal_strength = min(100, int((rssi / 31) * 100))
-            else:
-                self.signal_strength = 0
+            self.signal_strength = self._rssi_to_percent(int(match.group(1)))
         
         # Get operator name
-        response = self._send_at_command("AT+COPS?")
-        match = re.search(r'\+COPS:\s*\d+,\d+,"([^"]*)"', response)
+        match = _COPS_RE.search(response)
         if match:
             self.operator_name = match.group(1)
     
+    @staticmethod
+    def _rssi_to_percent(rssi: int) -> int:
+        """Convert RSSI to percentage (0-31 scale, 99=unknown)"""
+        if rssi != 99:
+            return min(100, int((rssi / 31) * 100))
+        return 0
+    
+    def _notify_network(self):
+        """Report the current network state to on_network_update"""
+        if self.on_network_update:
+            self.on_network_update(NetworkStatus(
+                registered=self.network_registered,
+                operator=self.operator_name,
+                signal=self.signal_strength
+            ))
+    
     def get_signal_strength(self) -> int:
         """
         Get signal strength percentage
@@ -770,6 +1091,21 @@ class SIM7600X:
             'signal': self.signal_strength
         }
     
+    def get_status_snapshot(self) -> NetworkStatus:
+        """
+        Get everything the status bar shows from a single modem query
+        
+        Returns:
+            NetworkStatus including the last known GPS fix
+        """
+        self._update_network_status()
+        return NetworkStatus(
+            registered=self.network_registered,
+            operator=self.operator_name,
+            signal=self.signal_strength,
+            gps=self.gps_data
+        )
+    
     # ==================== APN CONFIGURATION ====================
     
     def set_apn(self, apn: str, username: str = "", password: str = "") -> bool:
@@ -800,7 +1136,7 @@ class SIM7600X:
     def get_apn(self) -> str:
         """Get current APN configuration"""
         response = self._send_at_command("AT+CGDCONT?")
-        match = re.search(r'\+CGDCONT:\s*1,"[^"]*","([^"]*)"', response)
+        match = _CGDCONT_RE.search(response)
         if match:
             return match.group(1)
         return ""
@@ -889,6 +1225,20 @@ class SIM7600X:
     
     def get_module_info(self) -> Dict:
         """Get module identification info"""
+        # All four identification commands in one round-trip; each answers
+        # with a single line, in order
+        response = self._send_at_command("AT+CGMI;+CGMM;+CGMR;+GSN", timeout=3)
+        parts = [line.strip() for line in response.split('\n')]
+        parts = [line for line in parts if line and line != "OK"]
+        if len(parts) == 4 and parts[3].isdigit() and len(parts[3]) == 15:
+            return {
+                'manufacturer': parts[0],
+                'model': parts[1],
+                'revision': parts[2],
+                'imei': parts[3]
+            }
+        
+        # Unexpected layout (echo on, a command rejected): ask one by one
         info = {}
         
         # Manufacturer
@@ -917,6 +1267,22 @@ class SIM7600X:
         """
         results = {}
         
+        # Everything in one round-trip. The module aborts a chained line at
+        # the first failing command (e.g. +CPIN? with no SIM), so only
+        # trust it when the whole line succeeded.
+        response = self._send_at_command(_CMD_SELF_TEST, timeout=5)
+        if response.endswith("OK"):
+            self._network_status_time = time.monotonic()
+            self._parse_network_status(response)
+            results['at_response'] = True
+            results['sim_card'] = "+CPIN: READY" in response
+            results['network'] = self.network_registered
+            results['signal'] = self.signal_strength > 0
+            results['gps_module'] = "+CGPS:" in response
+            return results
+        
+        # Otherwise test each step on its own to see which one failed
+        
         # Basic AT test
         response = self._send_at_command("AT")
         results['at_response'] = "OK" in response
@@ -926,7 +1292,7 @@ class SIM7600X:
         results['sim_card'] = sim_status == "READY"
         
         # Network
-        self._update_network_status()
+        self._update_network_status(force=True)
         results['network'] = self.network_registered
         
         # Signal
@@ -961,11 +1327,17 @@ class SIM7600XSimulator(SIM7600X):
             hdop=1.2,
             fix_type=3
         )
-        self._sms_storage: List[SMSMessage] = [
-            SMSMessage(1, "REC READ", "+15551234567", "24/01/01,12:00:00", "Hello! This is a test message."),
-            SMSMessage(2, "REC UNREAD", "+15559876543", "24/01/01,12:30:00", "Welcome to PiPhone!"),
-        ]
+        # Keyed by storage index; dicts keep insertion order for list_sms
+        self._sms_storage: Dict[int, SMSMessage] = {
+            1: SMSMessage(1, "REC READ", "+15551234567", "24/01/01,12:00:00", "Hello! This is a test message."),
+            2: SMSMessage(2, "REC UNREAD", "+15559876543", "24/01/01,12:30:00", "Welcome to PiPhone!"),
+        }
         self._sms_counter = 3
+        self._last_ts_sec = 0
+        self._last_ts_str = ""
+        
+        # Own generator for GPS jitter rather than the shared module one
+        self._rng = random.Random()
     
     def connect(self) -> bool:
         self.connected = True
@@ -974,7 +1346,7 @@ class SIM7600XSimulator(SIM7600X):
     def disconnect(self):
         self.connected = False
     
-    def _send_at_command(self, command: str, timeout: float = 2.0) -> str:
+    def _send_at_command(self, command: Union[str, bytes], timeout: float = 2.0) -> str:
         return "OK"
     
     def dial(self, number: str) -> bool:
@@ -992,51 +1364,61 @@ class SIM7600XSimulator(SIM7600X):
         return True
     
     def send_sms(self, number: str, message: str) -> bool:
-        self._sms_storage.append(SMSMessage(
+        self._sms_storage[self._sms_counter] = SMSMessage(
             self._sms_counter,
             "STO SENT",
             number,
             time.strftime("%y/%m/%d,%H:%M:%S"),
             message
-        ))
+        )
         self._sms_counter += 1
         return True
     
     def list_sms(self, status: str = "ALL") -> List[SMSMessage]:
-        return self._sms_storage
+        return list(self._sms_storage.values())
     
     def read_sms(self, index: int) -> Optional[SMSMessage]:
-        for sms in self._sms_storage:
-            if sms.index == index:
-                return sms
-        return None
+        return self._sms_storage.get(index)
     
     def delete_sms(self, index: int) -> bool:
-        self._sms_storage = [s for s in self._sms_storage if s.index != index]
+        self._sms_storage.pop(index, None)
         return True
     
     def gps_power_on(self) -> bool:
         self.gps_data.fix_status = True
         self.gps_data.fix_type = 3
+        if self.on_gps_update:
+            self.on_gps_update(self.gps_data)
         return True
     
     def gps_power_off(self) -> bool:
         self.gps_data.fix_status = False
         self.gps_data.fix_type = 0
+        if self.on_gps_update:
+            self.on_gps_update(self.gps_data)
         return True
     
     def get_gps_position(self) -> GPSData:
         # Simulate slight movement
-        import random
         if self.gps_data.fix_status:
-            self.gps_data.latitude += random.uniform(-0.0001, 0.0001)
-            self.gps_data.longitude += random.uniform(-0.0001, 0.0001)
-            self.gps_data.speed = random.uniform(0, 5)
-            self.gps_data.course = random.uniform(0, 360)
-            self.gps_data.satellites = random.randint(6, 12)
-            self.gps_data.hdop = random.uniform(0.8, 2.5)
-            self.gps_data.fix_type = 3
-        self.gps_data.timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+            uniform = self._rng.uniform
+            gps = self.gps_data
+            gps.latitude += uniform(-0.0001, 0.0001)
+            gps.longitude += uniform(-0.0001, 0.0001)
+            gps.speed = uniform(0, 5)
+            gps.course = uniform(0, 360)
+            gps.satellites = self._rng.randint(6, 12)
+            gps.hdop = uniform(0.8, 2.5)
+            gps.fix_type = 3
+        
+        # The timestamp only has one-second resolution; format it once a second
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts_sec = now
+            self._last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        self.gps_data.timestamp = self._last_ts_str
+        if self.on_gps_update:
+            self.on_gps_update(self.gps_data)
         return self.gps_data
     
     def get_gps_status(self) -> dict:
@@ -3,11 +3,46 @@ PiPhone-X Custom UI Components
 Touch-optimized widgets for 480x320 display
 """
 
+import math
 import tkinter as tk
+from functools import lru_cache, partial
 from tkinter import Canvas
 from typing import Callable, Optional, List, Tuple
 from .theme import Theme, Colors
 
+# Fonts shared by every instance, rather than a new tuple per widget
+_ICON_FONT = (Theme.FONT_FAMILY, 20)
+_KEY_FONT = (Theme.FONT_FAMILY, 20, "bold")
+_GLYPH_FONT = (Theme.FONT_FAMILY, 18)
+_SUB_FONT = (Theme.FONT_FAMILY, 7)
+
+
+@lru_cache(maxsize=64)
+def _rounded_rect_points(x1: int, y1: int, x2: int, y2: int, r: int, steps: int = 8) -> tuple:
+    """
+    Outline of a rounded rectangle as a flat, unsmoothed polygon
+    
+    Each corner is a quarter circle of `steps` segments, so Tk can draw
+    it without spline smoothing. A radius past half the short side
+    gives a circle or stadium shape.
+    """
+    r = min(r, (x2 - x1) / 2, (y2 - y1) / 2)
+    # Corner centres with the angle each quarter-arc starts at (screen
+    # coordinates, y down), going clockwise from the top-right
+    corners = (
+        (x2 - r, y1 + r, -90),
+        (x2 - r, y2 - r, 0),
+        (x1 + r, y2 - r, 90),
+        (x1 + r, y1 + r, 180),
+    )
+    points = []
+    for cx, cy, start in corners:
+        for i in range(steps + 1):
+            angle = math.radians(start + 90 * i / steps)
+            points.append(round(cx + r * math.cos(angle)))
+            points.append(round(cy + r * math.sin(angle)))
+    return tuple(points)
+
 
 class TouchButton(Canvas):
     """
@@ -39,6 +74,8 @@ class TouchButton(Canvas):
         self.font = font or Theme.FONT_MEDIUM
         self.command = command
         self.pressed = False
+        self._w, self._h = width, height
+        self._rr_points = _rounded_rect_points(2, 2, width-2, height-2, radius)
         
         super().__init__(
             parent,
@@ -49,7 +86,7 @@ class TouchButton(Canvas):
             **kwargs
         )
         
-        self._draw()
+        self._create_items()
         
         # Bind events
         self.bind("<Enter>", self._on_enter)
@@ -57,66 +94,51 @@ class TouchButton(Canvas):
         self.bind("<Button-1>", self._on_press)
         self.bind("<ButtonRelease-1>", self._on_release)
     
-    def _draw(self, hover: bool = False, pressed: bool = False):
-        """Draw the button with current state"""
-        self.delete("all")
-        
-        w = self.winfo_reqwidth()
-        h = self.winfo_reqheight()
-        r = self.radius
-        
-        # Choose color based on state
-        if pressed:
-            fill = self.hover_color
-        elif hover:
-            fill = self.hover_color
-        else:
-            fill = self.bg_color
+    def _create_items(self):
+        """Create the canvas items; state changes only reconfigure them"""
+        w, h = self._w, self._h
         
         # Draw rounded rectangle
-        self._rounded_rect(2, 2, w-2, h-2, r, fill)
+        self._fill = self.bg_color
+        self._rr_id = self.create_polygon(self._rr_points, fill=self._fill)
         
         # Draw text/icon
         if self.icon:
-            self.create_text(
+            self._icon_id = self.create_text(
                 w//2, h//2 - 8,
                 text=self.icon,
                 fill=self.fg_color,
-                font=(Theme.FONT_FAMILY, 20)
+                font=_ICON_FONT
+            )
+            self._text_id = self.create_text(
+                w//2, h//2 + 12,
+                text=self.text,
+                fill=self.fg_color,
+                font=Theme.FONT_TINY
             )
-            if self.text:
-                self.create_text(
-                    w//2, h//2 + 12,
-                    text=self.text,
-                    fill=self.fg_color,
-                    font=Theme.FONT_TINY
-                )
         else:
-            self.create_text(
+            self._icon_id = None
+            self._text_id = self.create_text(
                 w//2, h//2,
                 text=self.text,
                 fill=self.fg_color,
                 font=self.font
             )
     
-    def _rounded_rect(self, x1, y1, x2, y2, r, fill):
-        """Draw a rounded rectangle"""
-        points = [
-            x1+r, y1,
-            x2-r, y1,
-            x2, y1,
-            x2, y1+r,
-            x2, y2-r,
-            x2, y2,
-            x2-r, y2,
-            x1+r, y2,
-            x1, y2,
-            x1, y2-r,
-            x1, y1+r,
-            x1, y1,
-            x1+r, y1
-        ]
-        self.create_polygon(points, fill=fill, smooth=True)
+    def _draw(self, hover: bool = False, pressed: bool = False):
+        """Recolor the button for its current state"""
+        # Choose color based on state
+        if pressed:
+            fill = self.hover_color
+        elif hover:
+            fill = self.hover_color
+        else:
+            fill = self.bg_color
+        
+        # Enter/leave/release often arrive without changing the look
+        if fill != self._fill:
+            self._fill = fill
+            self.itemconfigure(self._rr_id, fill=fill)
     
     def _on_enter(self, event):
         self._draw(hover=True)
@@ -138,7 +160,7 @@ class TouchButton(Canvas):
     def set_text(self, text: str):
         """Update button text"""
         self.text = text
-        self._draw()
+        self.itemconfigure(self._text_id, text=text)
     
     def set_colors(self, bg: str = None, fg: str = None):
         """Update button colors"""
@@ -146,6 +168,9 @@ class TouchButton(Canvas):
             self.bg_color = bg
         if fg:
             self.fg_color = fg
+            self.itemconfigure(self._text_id, fill=fg)
+            if self._icon_id:
+                self.itemconfigure(self._icon_id, fill=fg)
         self._draw()
 
 
@@ -182,24 +207,22 @@ class CircleButton(Canvas):
             **kwargs
         )
         
-        self._draw()
+        s = self.size
+        pad = 2
+        
+        # Draw circle and text once; presses just swap their colors
+        self._circle_id = self.create_oval(pad, pad, s-pad, s-pad, fill=self.bg_color, outline="")
+        self._text_id = self.create_text(s//2, s//2, text=self.text, fill=self.fg_color, font=self.font)
         
         self.bind("<Button-1>", self._on_press)
         self.bind("<ButtonRelease-1>", self._on_release)
     
     def _draw(self, pressed: bool = False):
-        self.delete("all")
-        s = self.size
-        pad = 2
-        
         color = self.bg_color if not pressed else self.fg_color
         text_color = self.fg_color if not pressed else self.bg_color
         
-        # Draw circle
-        self.create_oval(pad, pad, s-pad, s-pad, fill=color, outline="")
-        
-        # Draw text
-        self.create_text(s//2, s//2, text=self.text, fill=text_color, font=self.font)
+        self.itemconfigure(self._circle_id, fill=color)
+        self.itemconfigure(self._text_id, fill=text_color)
     
     def _on_press(self, event):
         self._draw(pressed=True)
@@ -210,82 +233,155 @@ class CircleButton(Canvas):
             self.command()
 
 
-class StatusBar(tk.Frame):
+class StatusBar(Canvas):
     """
     Top status bar showing time, signal, battery, and close button
+    
+    Drawn as text items on a single canvas, so an update is one
+    itemconfigure rather than a Label reconfigure and geometry pass.
+    Unchanged values are skipped entirely, and re-laying out after
+    several updates happens once, at idle time.
     """
     
     def __init__(self, parent, **kwargs):
         colors = Theme.colors
-        super().__init__(parent, bg=colors.status_bg, height=Theme.STATUS_BAR_HEIGHT, **kwargs)
+        super().__init__(
+            parent,
+            bg=colors.status_bg,
+            height=Theme.STATUS_BAR_HEIGHT,
+            highlightthickness=0,
+            **kwargs
+        )
         
         self.colors = colors
+        self._texts = {}
+        self._relayout_left = False
+        self._relayout_right = False
+        self._layout_scheduled = False
+        y = Theme.STATUS_BAR_HEIGHT // 2
         
         # Close button (X) on far left
-        self.close_btn = tk.Label(
-            self,
-            text="✕",
-            font=("Arial", 14, "bold"),
-            bg=colors.status_bg,
-            fg="#ff5555",
-            cursor="hand2"
+        self.close_btn = self.create_text(
+            10, y, text="✕", anchor=tk.W,
+            font=("Arial", 14, "bold"), fill="#ff5555"
         )
-        self.close_btn.pack(side=tk.LEFT, padx=(10, 4))
-        self.close_btn.bind("<Button-1>", self._on_close_click)
-        self.close_btn.bind("<Enter>", lambda e: self.close_btn.config(fg="#ff0000"))
-        self.close_btn.bind("<Leave>", lambda e: self.close_btn.config(fg="#ff5555"))
+        self.tag_bind(self.close_btn, "<Button-1>", self._on_close_click)
+        self.tag_bind(self.close_btn, "<Enter>",
+                      lambda e: self.itemconfigure(self.close_btn, fill="#ff0000"))
+        self.tag_bind(self.close_btn, "<Leave>",
+                      lambda e: self.itemconfigure(self.close_btn, fill="#ff5555"))
         
         # Time display
-        self.time_label = tk.Label(
-            self,
-            text="12:00 PM",
-            font=Theme.FONT_SMALL,
-            bg=colors.status_bg,
-            fg=colors.text_primary
+        self.time_item = self.create_text(
+            0, y, text="12:00 PM", anchor=tk.W,
+            font=Theme.FONT_SMALL, fill=colors.text_primary
         )
-        self.time_label.pack(side=tk.LEFT, padx=6)
         
         # Operator name
-        self.operator_label = tk.Label(
-            self,
-            text="",
-            font=Theme.FONT_TINY,
-            bg=colors.status_bg,
-            fg=colors.text_secondary
+        self.operator_item = self.create_text(
+            0, y, text="", anchor=tk.W,
+            font=Theme.FONT_TINY, fill=colors.text_secondary
         )
-        self.operator_label.pack(side=tk.LEFT, padx=5)
         
-        # Right side - signal, battery
-        self.battery_label = tk.Label(
-            self,
-            text="🔋",
-            font=Theme.FONT_SMALL,
-            bg=colors.status_bg,
-            fg=colors.text_primary
+        # Right side - battery, signal, GPS and simulation indicators
+        self.battery_item = self.create_text(
+            0, y, text="🔋", anchor=tk.E,
+            font=Theme.FONT_SMALL, fill=colors.text_primary
         )
-        self.battery_label.pack(side=tk.RIGHT, padx=10)
-        
-        self.signal_label = tk.Label(
-            self,
-            text="📶",
-            font=Theme.FONT_SMALL,
-            bg=colors.status_bg,
-            fg=colors.text_primary
+        self.signal_item = self.create_text(
+            0, y, text="", anchor=tk.E,
+            font=Theme.FONT_SMALL, fill=colors.text_primary
         )
-        self.signal_label.pack(side=tk.RIGHT, padx=5)
         
-        # GPS indicator
-        self.gps_label = tk.Label(
-            self,
-            text="",
-            font=Theme.FONT_TINY,
-            bg=colors.status_bg,
-            fg=colors.accent_primary
+        # Signal bars, left of the percentage; only their fill changes
+        self._bars = [
+            self.create_rectangle(0, 0, 0, 0, outline="", fill=colors.text_muted)
+            for _ in range(4)
+        ]
+        self._bars_lit = 0
+        self.gps_item = self.create_text(
+            0, y, text="", anchor=tk.E,
+            font=Theme.FONT_TINY, fill=colors.accent_primary
+        )
+        self.sim_item = self.create_text(
+            0, y, text="", anchor=tk.E,
+            font=Theme.FONT_TINY, fill=colors.accent_warning
         )
-        self.gps_label.pack(side=tk.RIGHT, padx=5)
+        
+        for item in (self.time_item, self.operator_item, self.battery_item,
+                     self.signal_item, self.gps_item, self.sim_item):
+            self._texts[item] = self.itemcget(item, "text")
+        
+        # (item, gap before it) in the order they are laid out
+        self._left = [(self.time_item, 10), (self.operator_item, 11)]
+        self._right = [(self.battery_item, 10), (self.signal_item, 15),
+                       (self._bars, 3), (self.gps_item, 10), (self.sim_item, 10)]
+        
+        self.bind("<Configure>", lambda e: self._layout_right(e.width))
+        self._layout_left()
+    
+    def _set_text(self, item: int, text: str, **options) -> bool:
+        """
+        Update an item's text, skipping unchanged values
+        
+        Returns:
+            True if the text changed (and the bar needs re-laying out)
+        """
+        if self._texts.get(item) == text:
+            return False
+        self._texts[item] = text
+        self.itemconfigure(item, text=text, **options)
+        return True
+    
+    def _schedule_layout(self, left: bool = False, right: bool = False):
+        """Re-lay out the changed side(s) once the current updates are done"""
+        self._relayout_left |= left
+        self._relayout_right |= right
+        if not self._layout_scheduled:
+            self._layout_scheduled = True
+            self.after_idle(self._flush_layout)
+    
+    def _flush_layout(self):
+        self._layout_scheduled = False
+        if self._relayout_left:
+            self._layout_left()
+        if self._relayout_right:
+            self._layout_right()
+        self._relayout_left = self._relayout_right = False
+    
+    def _layout_left(self):
+        """Place left-hand items one after another"""
+        x = self.bbox(self.close_btn)[2]
+        for item, gap in self._left:
+            self.coords(item, x + gap, Theme.STATUS_BAR_HEIGHT // 2)
+            if self._texts[item]:
+                x = self.bbox(item)[2]
+    
+    def _layout_right(self, width: int = None):
+        """Place right-hand items inwards from the right edge"""
+        x = width if width is not None else self.winfo_width()
+        for item, gap in self._right:
+            x -= gap
+            if item is self._bars:
+                x = self._place_bars(x)
+                continue
+            self.coords(item, x, Theme.STATUS_BAR_HEIGHT // 2)
+            if self._texts[item]:
+                x = self.bbox(item)[0]
+    
+    def _place_bars(self, right: int) -> int:
+        """Lay the signal bars out ending at x=right; returns their left edge"""
+        bottom = Theme.STATUS_BAR_HEIGHT // 2 + 6
+        x = right - 4 * 4 + 1
+        left = x
+        for i, bar in enumerate(self._bars):
+            self.coords(bar, x, bottom - 4 - 3 * i, x + 3, bottom)
+            x += 4
+        return left
     
     def update_time(self, time_str: str):
-        self.time_label.config(text=time_str)
+        if self._set_text(self.time_item, time_str):
+            self._schedule_layout(left=True)
     
     def _on_close_click(self, event):
         """Close the application"""
@@ -295,28 +391,35 @@ class StatusBar(tk.Frame):
     
     def update_signal(self, strength: int):
         """Update signal strength (0-100)"""
-        if strength > 75:
-            text = "📶"
-        elif strength > 50:
-            text = "📶"
-        elif strength > 25:
-            text = "📶"
-        elif strength > 0:
-            text = "📶"
-        else:
-            text = "✕"
-        self.signal_label.config(text=f"{text} {strength}%")
+        # Any signal lights at least one of the four bars
+        lit = min(4, (strength + 24) // 25) if strength > 0 else 0
+        if lit != self._bars_lit:
+            for i, bar in enumerate(self._bars):
+                fill = self.colors.text_primary if i < lit else self.colors.text_muted
+                self.itemconfigure(bar, fill=fill)
+            self._bars_lit = lit
+        
+        text = f"{strength}%" if strength > 0 else "✕"
+        if self._set_text(self.signal_item, text):
+            self._schedule_layout(right=True)
     
     def update_operator(self, name: str):
-        self.operator_label.config(text=name)
+        self._set_text(self.operator_item, name)
     
     def update_gps(self, active: bool, has_fix: bool = False):
         if active and has_fix:
-            self.gps_label.config(text="GPS ●", fg=self.colors.accent_success)
+            changed = self._set_text(self.gps_item, "GPS ●", fill=self.colors.accent_success)
         elif active:
-            self.gps_label.config(text="GPS ○", fg=self.colors.accent_warning)
+            changed = self._set_text(self.gps_item, "GPS ○", fill=self.colors.accent_warning)
         else:
-            self.gps_label.config(text="")
+            changed = self._set_text(self.gps_item, "")
+        if changed:
+            self._schedule_layout(right=True)
+    
+    def show_simulation(self, visible: bool = True):
+        """Show the SIM indicator used when running without a modem"""
+        if self._set_text(self.sim_item, "SIM" if visible else ""):
+            self._schedule_layout(right=True)
 
 
 class TabBar(tk.Frame):
@@ -335,10 +438,16 @@ class TabBar(tk.Frame):
         
         self.colors = colors
         self.tabs = []
-        self.active_index = 0
+        self.active_index = None
         
         # Calculate tab width
         tab_width = Theme.WIDTH // len(tabs)
+        self._tab_width = tab_width
+        
+        # One click handler for the whole bar: every tab widget carries
+        # this bind tag and the tab is found from the click position
+        click_tag = f"TabBarClick{id(self)}"
+        self.bind_class(click_tag, "<Button-1>", self._route_click)
         
         for i, (icon, label, callback) in enumerate(tabs):
             tab = tk.Frame(self, bg=colors.tab_bg, width=tab_width, height=Theme.TAB_BAR_HEIGHT)
@@ -348,7 +457,7 @@ class TabBar(tk.Frame):
             icon_label = tk.Label(
                 tab,
                 text=icon,
-                font=(Theme.FONT_FAMILY, 18),
+                font=_GLYPH_FONT,
                 bg=colors.tab_bg,
                 fg=colors.tab_inactive
             )
@@ -372,18 +481,27 @@ class TabBar(tk.Frame):
             }
             self.tabs.append(tab_data)
             
-            # Bind click events
-            tab.bind("<Button-1>", lambda e, idx=i: self._select_tab(idx))
-            icon_label.bind("<Button-1>", lambda e, idx=i: self._select_tab(idx))
-            text_label.bind("<Button-1>", lambda e, idx=i: self._select_tab(idx))
+            # Route click events
+            for widget in (tab, icon_label, text_label):
+                widget.bindtags((click_tag,) + widget.bindtags())
         
         # Select first tab
         self._select_tab(0)
     
+    def _route_click(self, event):
+        """Select the tab under a click on any part of the bar"""
+        x = event.x_root - self.winfo_rootx()
+        index = min(max(x // self._tab_width, 0), len(self.tabs) - 1)
+        self._select_tab(index)
+    
     def _select_tab(self, index: int):
         """Select a tab by index"""
+        # Tapping the tab that is already showing changes nothing
+        if index == self.active_index:
+            return
+        
         # Deselect previous
-        if self.active_index < len(self.tabs):
+        if self.active_index is not None:
             prev = self.tabs[self.active_index]
             prev['icon'].config(fg=self.colors.tab_inactive)
             prev['text'].config(fg=self.colors.tab_inactive)
@@ -443,36 +561,55 @@ class NumPad(tk.Frame):
             ('#', ''),
         ]
         
-        # Create grid - sized for 320x480 portrait display (406px available)
+        self._keys = [key for key, sub in keys]
+        self._pressed = None
+        self._key_fill = colors.surface_light
+        self._key_pressed_fill = colors.key_hover
+        
+        # All twelve keys live on one canvas - sized for 320x480 portrait
+        # display (406px available). Each cell keeps the 3px/2px padding
+        # the keys had when they were separate widgets.
         key_size = 58
+        self._cell_w = key_size + 6
+        self._cell_h = key_size + 4
+        self.pad = Canvas(
+            self,
+            width=3 * self._cell_w,
+            height=4 * self._cell_h,
+            bg=colors.background,
+            highlightthickness=0
+        )
+        self.pad.grid(row=0, column=0, rowspan=4, columnspan=3)
+        
+        self._key_ids = []
         for i, (key, sub) in enumerate(keys):
             row = i // 3
             col = i % 3
+            x = col * self._cell_w + 3
+            y = row * self._cell_h + 2
             
-            btn_frame = tk.Frame(self, bg=colors.background)
-            btn_frame.grid(row=row, column=col, padx=3, pady=2)
-            
-            btn = TouchButton(
-                btn_frame,
+            points = _rounded_rect_points(
+                x + 2, y + 2, x + key_size - 2, y + key_size - 2, key_size//2
+            )
+            self._key_ids.append(self.pad.create_polygon(points, fill=self._key_fill))
+            self.pad.create_text(
+                x + key_size//2, y + key_size//2,
                 text=key,
-                command=lambda k=key: self._on_key_press(k),
-                width=key_size,
-                height=key_size,
-                font=(Theme.FONT_FAMILY, 20, "bold"),
-                radius=key_size//2
+                fill=colors.text_primary,
+                font=_KEY_FONT
             )
-            btn.pack()
             
             # Add sub-label (positioned inside the button area)
             if sub:
-                sub_label = tk.Label(
-                    btn_frame,
+                self.pad.create_text(
+                    x + key_size//2, y + int(key_size * 0.75),
                     text=sub,
-                    font=(Theme.FONT_FAMILY, 7),
-                    bg=colors.background,
-                    fg=colors.text_muted
+                    fill=colors.text_muted,
+                    font=_SUB_FONT
                 )
-                sub_label.place(relx=0.5, rely=0.75, anchor=tk.CENTER)
+        
+        self.pad.bind("<Button-1>", self._on_pad_press)
+        self.pad.bind("<ButtonRelease-1>", self._on_pad_release)
         
         # Call/Hangup buttons
         if show_call_buttons:
@@ -507,21 +644,51 @@ class NumPad(tk.Frame):
                     command=self.on_backspace,
                     width=55,
                     height=55,
-                    font=(Theme.FONT_FAMILY, 18),
+                    font=_GLYPH_FONT,
                     radius=27
                 )
                 self.back_btn.pack(side=tk.LEFT, padx=12)
     
+    def _hit(self, event) -> Optional[int]:
+        """Index of the key under a pad event, or None"""
+        col = event.x // self._cell_w
+        row = event.y // self._cell_h
+        if 0 <= col < 3 and 0 <= row < 4:
+            return row * 3 + col
+        return None
+    
+    def _on_pad_press(self, event):
+        index = self._hit(event)
+        if index is not None:
+            self._pressed = index
+            self.pad.itemconfigure(self._key_ids[index], fill=self._key_pressed_fill)
+    
+    def _on_pad_release(self, event):
+        index = self._pressed
+        if index is None:
+            return
+        self._pressed = None
+        self.pad.itemconfigure(self._key_ids[index], fill=self._key_fill)
+        
+        # Like a button, only fire if released over the key that was pressed
+        if self._hit(event) == index:
+            self._on_key_press(self._keys[index])
+    
     def _on_key_press(self, key: str):
         if self.on_key:
             self.on_key(key)
 
 
-class MessageBubble(tk.Frame):
+class MessageBubble(Canvas):
     """
     Chat message bubble for SMS display - compact for 320px width
+    
+    One canvas per message: the bubble shape, text and timestamp are
+    canvas items, laid out again only when the text or width changes.
     """
     
+    WRAP = 200
+    
     def __init__(
         self,
         parent,
@@ -531,45 +698,82 @@ class MessageBubble(tk.Frame):
         **kwargs
     ):
         colors = Theme.colors
-        super().__init__(parent, bg=colors.background, **kwargs)
+        super().__init__(
+            parent,
+            bg=colors.background,
+            height=1,
+            highlightthickness=0,
+            **kwargs
+        )
         
-        # Choose alignment and colors - compact for 320px width
+        self._is_sent = is_sent
+        self._width = 0
+        
+        # Bubble shape, message text and compact timestamp
+        self._shape = self.create_polygon(0, 0, 0, 0, 0, 0)
+        self._msg_item = self.create_text(
+            0, 0, anchor=tk.NW, width=self.WRAP,
+            font=Theme.FONT_TINY, justify=tk.LEFT
+        )
+        self._time_item = self.create_text(0, 0, anchor=tk.NE, font=_SUB_FONT)
+        
+        self.bind("<Configure>", self._on_resize)
+        self.set_message(message, timestamp, is_sent)
+    
+    def set_message(self, message: str, timestamp: str, is_sent: bool = False):
+        """Show a different message, reusing this bubble's canvas items"""
+        colors = Theme.colors
+        
+        # Choose colors - compact for 320px width
         if is_sent:
             bg_color = colors.accent_primary
             fg_color = colors.background
-            anchor = tk.E
-            padx = (40, 5)
         else:
             bg_color = colors.surface_light
             fg_color = colors.text_primary
-            anchor = tk.W
-            padx = (5, 40)
-        
-        # Bubble frame
-        bubble = tk.Frame(self, bg=bg_color)
-        bubble.pack(anchor=anchor, padx=padx, pady=2)
-        
-        # Message text
-        msg_label = tk.Label(
-            bubble,
-            text=message,
-            font=Theme.FONT_TINY,
-            bg=bg_color,
-            fg=fg_color,
-            wraplength=200,
-            justify=tk.LEFT
-        )
-        msg_label.pack(padx=8, pady=4)
         
-        # Timestamp - compact
-        time_label = tk.Label(
-            bubble,
+        self._is_sent = is_sent
+        self.itemconfigure(self._shape, fill=bg_color)
+        self.itemconfigure(self._msg_item, text=message, fill=fg_color)
+        self.itemconfigure(
+            self._time_item,
             text=timestamp,
-            font=(Theme.FONT_FAMILY, 7),
-            bg=bg_color,
-            fg=fg_color if is_sent else colors.text_muted
+            fill=fg_color if is_sent else colors.text_muted
         )
-        time_label.pack(padx=8, pady=(0, 3), anchor=tk.E)
+        self._layout()
+    
+    def _on_resize(self, event):
+        if event.width != self._width:
+            self._width = event.width
+            self._layout()
+    
+    def _layout(self):
+        """Size the bubble to its text and align it left or right"""
+        # Empty text items have no bbox
+        mx1, my1, mx2, my2 = self.bbox(self._msg_item) or (0, 0, 0, 0)
+        tx1, ty1, tx2, ty2 = self.bbox(self._time_item) or (0, 0, 0, 0)
+        text_h = my2 - my1
+        
+        bubble_w = max(mx2 - mx1, tx2 - tx1) + 16
+        bubble_h = 4 + text_h + 4 + (ty2 - ty1) + 3
+        
+        # Sent messages hug the right edge, received ones the left
+        if self._is_sent:
+            x2 = max(self._width - 5, bubble_w + 40)
+            x1 = x2 - bubble_w
+        else:
+            x1 = 5
+            x2 = x1 + bubble_w
+        y1 = 2
+        y2 = y1 + bubble_h
+        
+        self.coords(self._shape, _rounded_rect_points(x1, y1, x2, y2, Theme.BUTTON_RADIUS))
+        self.coords(self._msg_item, x1 + 8, y1 + 4)
+        self.coords(self._time_item, x2 - 8, y1 + 4 + text_h + 4)
+        
+        height = bubble_h + 4
+        if int(self.cget("height")) != height:
+            self.configure(height=height)
 
 
 class ScrollableFrame(tk.Frame):
@@ -589,15 +793,8 @@ class ScrollableFrame(tk.Frame):
         )
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        # Scrollbar (hidden by default on touch)
-        self.scrollbar = tk.Scrollbar(
-            self,
-            orient=tk.VERTICAL,
-            command=self.canvas.yview
-        )
-        # self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        # No scrollbar on touch; the view is dragged instead
+        self.canvas.configure(yscrollcommand=self._on_yview)
         
         # Inner frame for content
         self.inner = tk.Frame(self.canvas, bg=colors.background)
@@ -616,20 +813,179 @@ class ScrollableFrame(tk.Frame):
         self.canvas.bind("<B1-Motion>", self._on_touch_move)
         
         self._touch_y = 0
+        self._pending_delta = 0
+        self._scroll_pending = False
+        
+        # Scroll position and sizes, kept current by the callbacks below
+        self._yfrac = 0.0
+        self._content_h = 0
+        self._view_h = 0
+        
+        # Message bubbles currently shown, and hidden ones kept for reuse
+        self._bubbles: List[MessageBubble] = []
+        self._bubble_pool: List[MessageBubble] = []
+        
+        # Virtual list state (see set_items)
+        self._items: list = []
+        self._row_height = 0
+        self._make_row: Optional[Callable] = None
+        self._fill_row: Optional[Callable] = None
+        self._rows: List[Tuple[tk.Widget, int]] = []
+        self._row_items: List[Optional[int]] = []
+    
+    def set_items(
+        self,
+        items: list,
+        make_row: Callable[[tk.Widget], tk.Widget],
+        fill_row: Callable[[tk.Widget, object], None],
+        row_height: int
+    ):
+        """
+        Show a long list of equal-height rows without a widget per item
+        
+        Only the rows in view exist as widgets; scrolling moves them and
+        refills them with fill_row instead of creating new ones.
+        
+        Args:
+            items: Data for each row, in display order
+            make_row: Creates an empty row widget on the given parent
+            fill_row: Shows an item in a row created by make_row
+            row_height: Height of every row in pixels
+        """
+        if make_row != self._make_row:
+            # Rows from a different factory can't be refilled
+            for row, window in self._rows:
+                self.canvas.delete(window)
+                row.destroy()
+            self._rows = []
+            self._row_items = []
+        
+        self._items = list(items)
+        self._make_row = make_row
+        self._fill_row = fill_row
+        self._row_height = row_height
+        
+        # The inner frame stays available for e.g. an empty-list message
+        self.canvas.itemconfigure(
+            self.canvas_window,
+            state=tk.HIDDEN if self._items else tk.NORMAL
+        )
+        
+        # Rows must be refilled, the data behind them may have changed
+        self._row_items = [None] * len(self._rows)
+        self._update_scrollregion()
+        self.canvas.yview_moveto(0)
+        self._render_rows()
+    
+    def _render_rows(self):
+        """Place and fill the row widgets that intersect the viewport"""
+        if not self._make_row:
+            return
+        
+        height = self.canvas.winfo_height()
+        total = len(self._items) * self._row_height
+        top = int(self.canvas.yview()[0] * total)
+        first = top // self._row_height if self._row_height else 0
+        last = min(len(self._items), first + height // max(self._row_height, 1) + 2)
+        
+        # Grow the pool to cover the viewport
+        while len(self._rows) < last - first:
+            row = self._make_row(self.canvas)
+            window = self.canvas.create_window(
+                0, 0,
+                window=row,
+                anchor=tk.NW,
+                width=self.canvas.winfo_width(),
+                height=self._row_height
+            )
+            self._rows.append((row, window))
+            self._row_items.append(None)
+        
+        for slot, (row, window) in enumerate(self._rows):
+            index = first + slot
+            if index >= last:
+                self.canvas.itemconfigure(window, state=tk.HIDDEN)
+                self._row_items[slot] = None
+                continue
+            if self._row_items[slot] != index:
+                self._fill_row(row, self._items[index])
+                self.canvas.coords(window, 0, index * self._row_height)
+                self._row_items[slot] = index
+            self.canvas.itemconfigure(window, state=tk.NORMAL)
+    
+    def _update_scrollregion(self):
+        if self._make_row and self._items:
+            total = len(self._items) * self._row_height
+            self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), total))
+            self._content_h = total
+        else:
+            bbox = self.canvas.bbox(self.canvas_window)
+            self.canvas.configure(scrollregion=bbox)
+            self._content_h = bbox[3] - bbox[1] if bbox else 0
+    
+    def _on_yview(self, first, last):
+        self._yfrac = float(first)
+        if self._items:
+            self._render_rows()
+    
+    def acquire_bubble(self, message: str, timestamp: str, is_sent: bool = False) -> MessageBubble:
+        """Append a message bubble, recycling a released one if possible"""
+        if self._bubble_pool:
+            bubble = self._bubble_pool.pop()
+            bubble.set_message(message, timestamp, is_sent)
+        else:
+            bubble = MessageBubble(self.inner, message, timestamp, is_sent)
+        bubble.pack(fill=tk.X)
+        self._bubbles.append(bubble)
+        return bubble
+    
+    def release_bubbles(self):
+        """Hide all bubbles and keep them for the next acquire_bubble"""
+        for bubble in self._bubbles:
+            bubble.pack_forget()
+        self._bubble_pool.extend(reversed(self._bubbles))
+        self._bubbles.clear()
     
     def _on_configure(self, event):
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        # The event already carries the inner frame's new size
+        if self._make_row and self._items:
+            return
+        self.canvas.configure(scrollregion=(0, 0, event.width, event.height))
+        self._content_h = event.height
     
     def _on_canvas_configure(self, event):
+        self._view_h = event.height
         self.canvas.itemconfig(self.canvas_window, width=event.width)
+        for row, window in self._rows:
+            self.canvas.itemconfig(window, width=event.width)
+        if self._items:
+            self._update_scrollregion()
+            self._render_rows()
     
     def _on_touch_start(self, event):
         self._touch_y = event.y
+        self._pending_delta = 0
     
     def _on_touch_move(self, event):
-        delta = self._touch_y - event.y
-        self.canvas.yview_scroll(int(delta/20), "units")
+        # Motion events come much faster than the screen redraws; add them
+        # up and scroll at most once per idle cycle
+        self._pending_delta += self._touch_y - event.y
         self._touch_y = event.y
+        if self._pending_delta and not self._scroll_pending:
+            self._scroll_pending = True
+            self.after_idle(self._flush_scroll)
+    
+    def _flush_scroll(self):
+        self._scroll_pending = False
+        delta, self._pending_delta = self._pending_delta, 0
+        
+        # Move the view by exactly the dragged pixels, using the sizes
+        # recorded on <Configure> instead of asking Tk for unit sizes
+        if self._content_h <= self._view_h:
+            return
+        top = 1.0 - self._view_h / self._content_h
+        self._yfrac = max(0.0, min(top, self._yfrac + delta / self._content_h))
+        self.canvas.yview_moveto(self._yfrac)
     
     def scroll_to_bottom(self):
         """Scroll to bottom of content"""
@@ -666,14 +1022,10 @@ class ProgressRing(Canvas):
             **kwargs
         )
         
-        self._draw()
-    
-    def _draw(self):
-        self.delete("all")
         pad = self.thickness // 2 + 2
         
         # Background ring
-        self.create_arc(
+        self._bg_arc = self.create_arc(
             pad, pad, self.size-pad, self.size-pad,
             start=90, extent=-360,
             outline=self.bg_ring,
@@ -682,10 +1034,9 @@ class ProgressRing(Canvas):
         )
         
         # Progress ring
-        extent = -360 * (self.progress / 100)
-        self.create_arc(
+        self._fg_arc = self.create_arc(
             pad, pad, self.size-pad, self.size-pad,
-            start=90, extent=extent,
+            start=90, extent=0,
             outline=self.fg_ring,
             width=self.thickness,
             style=tk.ARC
@@ -693,8 +1044,10 @@ class ProgressRing(Canvas):
     
     def set_progress(self, value: int):
         """Set progress value (0-100)"""
-        self.progress = max(0, min(100, value))
-        self._draw()
+        value = max(0, min(100, value))
+        if value != self.progress:
+            self.progress = value
+            self.itemconfigure(self._fg_arc, extent=-360 * (value / 100))
 
 
 class VirtualKeyboard(tk.Toplevel):
@@ -703,6 +1056,25 @@ class VirtualKeyboard(tk.Toplevel):
     Full-width keyboard with all keys visible
     """
     
+    # Key colors as (bg, fg, active bg)
+    _KEY_COLORS = {
+        "DONE": ("#00cc99", "#000000", "#00ffbb"),
+        "DEL": ("#dd4444", "#ffffff", "#ff6666"),
+        "CAP": ("#3a3a5a", "#ffffff", "#5a5a7a"),
+        "123": ("#3a3a5a", "#ffffff", "#5a5a7a"),
+        "ABC": ("#3a3a5a", "#ffffff", "#5a5a7a"),
+        "SPC": ("#3a3a5a", "#ffffff", "#5a5a7a"),
+    }
+    _DEFAULT_COLORS = ("#454570", "#ffffff", "#6565a0")
+    _SHIFT_COLORS = ("#00cc99", "#000000", "#00ffbb")
+    
+    # Labels for keys that don't show their own name
+    _KEY_DISPLAY = {
+        "SPC": "space",
+        "DONE": "OK",
+        "DEL": "<-",
+    }
+    
     def __init__(self, parent, target_entry, on_done: Callable = None):
         super().__init__(parent)
         
@@ -715,45 +1087,61 @@ class VirtualKeyboard(tk.Toplevel):
         self.title("Keyboard")
         self.configure(bg="#1e1e2e")
         
+        # The main window is already mapped, so its position is known
+        # without forcing a layout pass
+        self._place()
+        self.resizable(False, False)
+        self.attributes('-topmost', True)
+        self.focus_set()
+        
+        # Build keyboard
+        self._build_keyboard()
+    
+    def _place(self):
+        """Position the keyboard along the bottom of the main window"""
         # Full screen width, fixed height
         kb_width = Theme.WIDTH  # 320px full width
         kb_height = 185
         
-        # Get screen position from parent
-        self.update_idletasks()
-        parent.update_idletasks()
-        
-        # Position at bottom of main window
-        root = parent.winfo_toplevel()
-        root_x = root.winfo_rootx()
-        root_y = root.winfo_rooty()
-        root_h = root.winfo_height()
-        
-        x = root_x
-        y = root_y + root_h - kb_height
+        root = self.master.winfo_toplevel()
+        x = root.winfo_rootx()
+        y = root.winfo_rooty() + root.winfo_height() - kb_height
         
         self.geometry(f"{kb_width}x{kb_height}+{x}+{y}")
-        self.resizable(False, False)
-        self.attributes('-topmost', True)
+    
+    def show(self, target_entry, on_done: Callable = None):
+        """Bring a hidden keyboard back, typing into target_entry"""
+        self.target = target_entry
+        self.on_done = on_done
+        self._place()
+        self.deiconify()
+        self.lift()
         self.focus_set()
-        
-        # Build keyboard
-        self._build_keyboard()
+    
+    @property
+    def visible(self) -> bool:
+        return self.state() != "withdrawn"
     
     def _build_keyboard(self):
-        """Build the keyboard UI"""
+        """Build both key layouts once; toggles only reconfigure them"""
         main = tk.Frame(self, bg="#1e1e2e")
         main.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
         self.keys_frame = main
-        self._draw_keys()
+        
+        self._key_colors = {}   # label -> (bg, active bg)
+        self._alpha_keys = []   # (key, label) for letters that change case
+        self._cap_key = None
+        
+        self._letters_frame = self._build_layout(main, symbols=False)
+        self._symbols_frame = self._build_layout(main, symbols=True)
+        self._apply_mode()
     
-    def _draw_keys(self):
-        """Draw all keyboard keys using grid for full width"""
-        for w in self.keys_frame.winfo_children():
-            w.destroy()
+    def _build_layout(self, parent, symbols: bool) -> tk.Frame:
+        """Create the keys of one layout in their own frame"""
+        frame = tk.Frame(parent, bg="#1e1e2e")
         
         # Layouts - use 10-column grid
-        if self.symbols_mode:
+        if symbols:
             rows = [
                 [("1",1), ("2",1), ("3",1), ("4",1), ("5",1), ("6",1), ("7",1), ("8",1), ("9",1), ("0",1)],
                 [("@",1), ("#",1), ("$",1), ("%",1), ("&",1), ("*",1), ("-",1), ("+",1), ("(",1), (")",1)],
@@ -770,44 +1158,54 @@ class VirtualKeyboard(tk.Toplevel):
         
         # Configure grid columns for even distribution
         for col in range(10):
-            self.keys_frame.columnconfigure(col, weight=1, uniform="keys")
+            frame.columnconfigure(col, weight=1, uniform="keys")
         
         for row_idx, row in enumerate(rows):
             col = 0
             for key, span in row:
                 if key is not None:
-                    self._make_key(self.keys_frame, key, row_idx, col, span)
+                    btn = self._make_key(frame, key, row_idx, col, span)
+                    if not symbols and len(key) == 1 and key.isalpha():
+                        self._alpha_keys.append((key, btn))
+                    elif key == "CAP":
+                        self._cap_key = btn
                 col += span
+        
+        return frame
+    
+    def _apply_mode(self):
+        """Show the letter or symbol layout"""
+        if self.symbols_mode:
+            self._letters_frame.pack_forget()
+            self._symbols_frame.pack(fill=tk.BOTH, expand=True)
+        else:
+            self._symbols_frame.pack_forget()
+            self._letters_frame.pack(fill=tk.BOTH, expand=True)
+    
+    def _apply_shift(self):
+        """Update letter case and the CAP key for the shift state"""
+        for key, btn in self._alpha_keys:
+            btn.config(text=key.upper() if self.shift_active else key.lower())
+        
+        bg, fg, abg = self._SHIFT_COLORS if self.shift_active else self._KEY_COLORS["CAP"]
+        self._cap_key.config(text="^^" if self.shift_active else "^", bg=bg, fg=fg)
+        self._key_colors[self._cap_key] = (bg, abg)
     
-    def _make_key(self, parent, key: str, row: int, col: int, colspan: int):
+    def _make_key(self, parent, key: str, row: int, col: int, colspan: int) -> tk.Label:
         """Create a key button in grid"""
         # Display text
-        if key == "SPC":
-            display = "space"
-        elif key == "DONE":
-            display = "OK"
-        elif key == "CAP":
+        if key == "CAP":
             display = "^" if not self.shift_active else "^^"
-        elif key == "DEL":
-            display = "<-"
-        elif key in ["123", "ABC"]:
-            display = key
-        elif not self.symbols_mode and key.isalpha():
+        elif len(key) == 1 and key.isalpha():
             display = key.upper() if self.shift_active else key.lower()
         else:
-            display = key
+            display = self._KEY_DISPLAY.get(key, key)
         
         # Colors
-        if key == "DONE":
-            bg, fg, abg = "#00cc99", "#000000", "#00ffbb"
-        elif key == "DEL":
-            bg, fg, abg = "#dd4444", "#ffffff", "#ff6666"
-        elif key == "CAP" and self.shift_active:
-            bg, fg, abg = "#00cc99", "#000000", "#00ffbb"
-        elif key in ["CAP", "123", "ABC", "SPC"]:
-            bg, fg, abg = "#3a3a5a", "#ffffff", "#5a5a7a"
+        if key == "CAP" and self.shift_active:
+            bg, fg, abg = self._SHIFT_COLORS
         else:
-            bg, fg, abg = "#454570", "#ffffff", "#6565a0"
+            bg, fg, abg = self._KEY_COLORS.get(key, self._DEFAULT_COLORS)
         
         btn = tk.Label(
             parent,
@@ -820,18 +1218,21 @@ class VirtualKeyboard(tk.Toplevel):
             pady=8
         )
         btn.grid(row=row, column=col, columnspan=colspan, sticky="nsew", padx=1, pady=1)
+        self._key_colors[btn] = (bg, abg)
         
         # Click events
-        btn.bind("<Button-1>", lambda e, k=key: self._on_click(e, k, bg, abg))
-        btn.bind("<ButtonRelease-1>", lambda e, k=key, b=btn, orig=bg: self._on_release(e, k, b, orig))
+        btn.bind("<Button-1>", self._on_click)
+        btn.bind("<ButtonRelease-1>", partial(self._on_release, key))
+        
+        return btn
     
-    def _on_click(self, event, key, bg, abg):
+    def _on_click(self, event):
         """Visual feedback on click"""
-        event.widget.configure(bg=abg)
+        event.widget.configure(bg=self._key_colors[event.widget][1])
     
-    def _on_release(self, event, key, btn, orig_bg):
+    def _on_release(self, key, event):
         """Handle key release"""
-        btn.configure(bg=orig_bg)
+        event.widget.configure(bg=self._key_colors[event.widget][0])
         self._press(key)
     
     def _press(self, key: str):
@@ -846,15 +1247,15 @@ class VirtualKeyboard(tk.Toplevel):
         
         elif key == "CAP":
             self.shift_active = not self.shift_active
-            self._draw_keys()
+            self._apply_shift()
         
         elif key == "123":
             self.symbols_mode = True
-            self._draw_keys()
+            self._apply_mode()
         
         elif key == "ABC":
             self.symbols_mode = False
-            self._draw_keys()
+            self._apply_mode()
         
         elif key == "SPC":
             self._type(" ")
@@ -862,7 +1263,7 @@ class VirtualKeyboard(tk.Toplevel):
         elif key == "DONE":
             if self.on_done:
                 self.on_done()
-            self.destroy()
+            self.withdraw()
         
         else:
             char = key.upper() if self.shift_active and key.isalpha() else key
@@ -878,7 +1279,8 @@ class VirtualKeyboard(tk.Toplevel):
             self.target.insert(tk.INSERT, char)
     
     def close(self):
-        self.destroy()
+        """Hide the keyboard; it is kept for the next show()"""
+        self.withdraw()
 
 
 class KeyboardButton(tk.Button):
@@ -886,9 +1288,12 @@ class KeyboardButton(tk.Button):
     Keyboard icon button to show virtual keyboard
     """
     
+    # One keyboard window shared by every button; building it is the
+    # slowest thing the UI does, so it is hidden rather than destroyed
+    _keyboard: Optional[VirtualKeyboard] = None
+    
     def __init__(self, parent, target_entry, **kwargs):
         self.target = target_entry
-        self.keyboard = None
         
         super().__init__(
             parent,
@@ -908,12 +1313,12 @@ class KeyboardButton(tk.Button):
     
     def _toggle(self):
         """Toggle keyboard visibility"""
-        if self.keyboard and self.keyboard.winfo_exists():
-            self.keyboard.destroy()
-            self.keyboard = None
-        else:
+        keyboard = KeyboardButton._keyboard
+        if keyboard is None or not keyboard.winfo_exists():
             root = self.winfo_toplevel()
-            self.keyboard = VirtualKeyboard(root, self.target, on_done=self._done)
-    
-    def _done(self):
-        self.keyboard = None
+            KeyboardButton._keyboard = VirtualKeyboard(root, self.target)
+        elif keyboard.visible and keyboard.target is self.target:
+            keyboard.withdraw()
+        else:
+            # Hidden, or open for another field: show it for this one
+            keyboard.show(self.target)
@@ -3,9 +3,12 @@ PiPhone-X Diagnostics & Testing Screen
 Hardware testing and AT command interface
 """
 
+import threading
+import time
 import tkinter as tk
+from functools import partial
 from tkinter import scrolledtext
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 from .theme import Theme, Colors
 from .components import TouchButton, ScrollableFrame, KeyboardButton
 
@@ -15,14 +18,45 @@ class DiagnosticsScreen(tk.Frame):
     Diagnostics screen for testing hardware and sending raw AT commands
     """
     
+    # Oldest console lines are dropped beyond this
+    MAX_CONSOLE_LINES = 1000
+    # How far below the cap a trim goes, so trims stay rare once full
+    CONSOLE_TRIM_LINES = 200
+    
+    # Repeat refreshes are ignored until this long after the last finished
+    REFRESH_DEBOUNCE_MS = 500
+    
     def __init__(self, parent, modem, **kwargs):
         colors = Theme.colors
         super().__init__(parent, bg=colors.background, **kwargs)
         
         self.colors = colors
+        
+        # Status colours used on every refresh
+        self._c_ok = colors.accent_success
+        self._c_warn = colors.accent_warning
+        self._c_err = colors.accent_danger
+        self._c_text = colors.text_primary
         self.modem = modem
         self.test_results = {}
         
+        # Last (text, fg) applied to each status label
+        self._label_state: Dict[tk.Label, Tuple[Optional[str], Optional[str]]] = {}
+        
+        # Console text and tag pairs waiting for the next flush
+        self._pending_writes = []
+        self._flush_scheduled = False
+        # Lines appended since the console was last trimmed or cleared
+        self._console_lines = 0
+        
+        # Modem query results keyed by name: (fetched_at, value)
+        self._info_cache: Dict[str, Tuple[float, Any]] = {}
+        
+        # Refreshes in flight or inside their debounce window, and forced
+        # refreshes to run once that window closes
+        self._refresh_pending = set()
+        self._refresh_rerun = set()
+        
         self._create_ui()
     
     def _create_ui(self):
@@ -72,11 +106,11 @@ class DiagnosticsScreen(tk.Frame):
         self.tab_content = tk.Frame(self.content, bg=self.colors.background)
         self.tab_content.pack(fill=tk.BOTH, expand=True)
         
-        # Create tab panels
-        self._create_self_test_panel()
-        self._create_module_info_panel()
-        self._create_at_console_panel()
-        self._create_network_panel()
+        # Tab panels are built the first time they are shown
+        self.test_panel = None
+        self.info_panel = None
+        self.console_panel = None
+        self.network_panel = None
         
         # Show first tab
         self._show_self_test()
@@ -195,7 +229,7 @@ class DiagnosticsScreen(tk.Frame):
         TouchButton(
             self.info_panel,
             text="Refresh",
-            command=self._refresh_module_info,
+            command=partial(self._refresh_module_info, force=True),
             width=120,
             height=36,
             font=Theme.FONT_SMALL
@@ -218,6 +252,11 @@ class DiagnosticsScreen(tk.Frame):
         self.console_output.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         self.console_output.config(state=tk.DISABLED)
         
+        # One tag per kind of output, configured once
+        self.console_output.tag_configure("cmd", foreground=self.colors.text_secondary)
+        self.console_output.tag_configure("resp", foreground=self.colors.accent_primary)
+        self.console_output.tag_configure("err", foreground=self.colors.accent_danger)
+        
         # Command input area
         input_frame = tk.Frame(self.console_panel, bg=self.colors.surface)
         input_frame.pack(fill=tk.X, padx=3, pady=3)
@@ -273,7 +312,7 @@ class DiagnosticsScreen(tk.Frame):
             TouchButton(
                 quick_frame,
                 text=label,
-                command=lambda c=cmd: self._quick_command(c),
+                command=partial(self._quick_command, cmd),
                 width=46,
                 height=24,
                 font=(Theme.FONT_FAMILY, 8)
@@ -341,6 +380,19 @@ class DiagnosticsScreen(tk.Frame):
         )
         self.signal_bar.pack(side=tk.LEFT, padx=8)
         
+        # Track and level are drawn once; refreshes only move the level
+        self.signal_bar.create_rectangle(
+            0, 0, 200, 12,
+            fill=self.colors.surface_light,
+            outline=""
+        )
+        self._signal_level = self.signal_bar.create_rectangle(
+            0, 0, 0, 12,
+            fill=self.colors.accent_danger,
+            outline=""
+        )
+        self._signal_shown = (0, self.colors.accent_danger)
+        
         # Network Mode Toggle Section
         mode_section = tk.Frame(self.network_panel, bg=self.colors.surface)
         mode_section.pack(fill=tk.X, padx=5, pady=3)
@@ -371,7 +423,7 @@ class DiagnosticsScreen(tk.Frame):
             btn = TouchButton(
                 mode_btns,
                 text=label,
-                command=lambda m=mode: self._set_network_mode(m),
+                command=partial(self._set_network_mode, mode),
                 width=55,
                 height=26,
                 font=(Theme.FONT_FAMILY, 8),
@@ -496,7 +548,7 @@ class DiagnosticsScreen(tk.Frame):
         TouchButton(
             btn_frame,
             text="Refresh",
-            command=self._refresh_network,
+            command=partial(self._refresh_network, force=True),
             width=70,
             height=28,
             font=(Theme.FONT_FAMILY, 8)
@@ -523,20 +575,24 @@ class DiagnosticsScreen(tk.Frame):
     
     def _hide_all_panels(self):
         """Hide all tab panels"""
-        self.test_panel.pack_forget()
-        self.info_panel.pack_forget()
-        self.console_panel.pack_forget()
-        self.network_panel.pack_forget()
+        for panel in (self.test_panel, self.info_panel,
+                      self.console_panel, self.network_panel):
+            if panel is not None:
+                panel.pack_forget()
     
     def _show_self_test(self):
         """Show self-test panel"""
         self._hide_all_panels()
+        if self.test_panel is None:
+            self._create_self_test_panel()
         self.test_panel.pack(fill=tk.BOTH, expand=True)
         self._highlight_tab(0)
     
     def _show_module_info(self):
         """Show module info panel"""
         self._hide_all_panels()
+        if self.info_panel is None:
+            self._create_module_info_panel()
         self.info_panel.pack(fill=tk.BOTH, expand=True)
         self._highlight_tab(1)
         self._refresh_module_info()
@@ -544,12 +600,16 @@ class DiagnosticsScreen(tk.Frame):
     def _show_at_console(self):
         """Show AT console panel"""
         self._hide_all_panels()
+        if self.console_panel is None:
+            self._create_at_console_panel()
         self.console_panel.pack(fill=tk.BOTH, expand=True)
         self._highlight_tab(2)
     
     def _show_network_info(self):
         """Show network panel"""
         self._hide_all_panels()
+        if self.network_panel is None:
+            self._create_network_panel()
         self.network_panel.pack(fill=tk.BOTH, expand=True)
         self._highlight_tab(3)
         self._load_current_apn()
@@ -566,52 +626,151 @@ class DiagnosticsScreen(tk.Frame):
     def _run_self_test(self):
         """Run diagnostic self-test"""
         if not self.modem:
-            self.test_summary.config(text="No modem connected", fg=self.colors.accent_danger)
+            self.test_summary.config(text="No modem connected", fg=self._c_err)
             return
         
         # Reset all items
         for label in self.test_items.values():
-            label.config(text="Testing...", fg=self.colors.accent_warning)
-        self.update()
-        
-        # Run tests
-        results = self.modem.run_self_test()
+            self._set_label(label, text="Testing...", fg=self._c_warn)
         
-        # Update display
+        self._in_background(
+            self.modem.run_self_test,
+            self._apply_self_test_results,
+            self._self_test_failed
+        )
+    
+    def _apply_self_test_results(self, results):
+        """Show self-test results"""
         passed = 0
         for key, result in results.items():
             if key in self.test_items:
                 if result:
-                    self.test_items[key].config(text="✓ PASS", fg=self.colors.accent_success)
+                    self._set_label(self.test_items[key], text="✓ PASS", fg=self._c_ok)
                     passed += 1
                 else:
-                    self.test_items[key].config(text="✗ FAIL", fg=self.colors.accent_danger)
+                    self._set_label(self.test_items[key], text="✗ FAIL", fg=self._c_err)
         
         total = len(results)
         self.test_summary.config(
             text=f"Tests completed: {passed}/{total} passed",
-            fg=self.colors.accent_success if passed == total else self.colors.accent_warning
+            fg=self._c_ok if passed == total else self._c_warn
         )
     
-    def _refresh_module_info(self):
-        """Refresh module information"""
-        if not self.modem:
+    def _self_test_failed(self, error):
+        """Show that the self-test could not run"""
+        for label in self.test_items.values():
+            self._set_label(label, text="✗ ERROR", fg=self._c_err)
+        
+        self.test_summary.config(text=f"Self-test failed: {error}", fg=self._c_err)
+    
+    def _set_label(self, label: tk.Label, text: Optional[str] = None, fg: Optional[str] = None):
+        """Configure a status label, skipping the call if nothing changed"""
+        old_text, old_fg = self._label_state.get(label, (None, None))
+        changes = {}
+        if text is not None and text != old_text:
+            changes['text'] = text
+        if fg is not None and fg != old_fg:
+            changes['fg'] = fg
+        if not changes:
             return
         
-        info = self.modem.get_module_info()
+        label.config(**changes)
+        self._label_state[label] = (changes.get('text', old_text), changes.get('fg', old_fg))
+    
+    def _in_background(self, fn: Callable[[], Any], on_done: Callable[[Any], None],
+                       on_error: Callable[[Exception], None]):
+        """
+        Run a modem call off the UI thread
+        
+        The result goes to on_done, or the exception to on_error, on the
+        Tk thread.
+        """
+        def worker():
+            try:
+                result = fn()
+            except Exception as e:
+                self.after(0, on_error, e)
+            else:
+                self.after(0, on_done, result)
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def _cached(self, key: str, ttl: float, fn: Callable[[], Any]) -> Any:
+        """Return fn() from the cache if it is younger than ttl seconds"""
+        now = time.monotonic()
+        hit = self._info_cache.get(key)
+        if hit and now - hit[0] < ttl:
+            return hit[1]
+        
+        value = fn()
+        self._info_cache[key] = (now, value)
+        return value
+    
+    def _refresh_busy(self, key: str, force: bool) -> bool:
+        """
+        Check whether a refresh of key is already running or debounced
+        
+        A forced refresh that arrives meanwhile is remembered and runs
+        when the window closes, so the result of a mode change or reset
+        is never lost.
+        """
+        if key not in self._refresh_pending:
+            return False
+        if force:
+            self._refresh_rerun.add(key)
+        return True
+    
+    def _release_refresh(self, key: str):
+        """End the debounce window for key and run any forced refresh"""
+        self._refresh_pending.discard(key)
+        if key in self._refresh_rerun:
+            self._refresh_rerun.discard(key)
+            if key == 'info':
+                self._refresh_module_info(force=True)
+            else:
+                self._refresh_network(force=True)
+    
+    def _refresh_module_info(self, force: bool = False):
+        """Refresh module information"""
+        if not self.modem or self._refresh_busy('info', force):
+            return
+        self._refresh_pending.add('info')
+        
+        if force:
+            self._info_cache.pop('module_info', None)
+            self._info_cache.pop('sim_status', None)
+        
+        def fetch():
+            try:
+                # Identity never changes; SIM state only on insert/unlock
+                info = self._cached('module_info', 3600, self.modem.get_module_info)
+                sim_status = self._cached('sim_status', 30, self.modem.get_sim_status)
+                return info, sim_status
+            finally:
+                self.after(self.REFRESH_DEBOUNCE_MS, self._release_refresh, 'info')
+        
+        self._in_background(fetch, self._apply_module_info, self._module_info_failed)
+    
+    def _apply_module_info(self, result):
+        """Show module information and SIM status"""
+        info, sim_status = result
         
         for key, value in info.items():
             if key in self.info_items:
-                self.info_items[key].config(text=value or "--")
+                self._set_label(self.info_items[key], text=value or "--")
         
         # SIM status
-        sim_status = self.modem.get_sim_status()
-        self.info_items['sim_status'].config(text=sim_status)
-        
-        if sim_status == "READY":
-            self.info_items['sim_status'].config(fg=self.colors.accent_success)
-        else:
-            self.info_items['sim_status'].config(fg=self.colors.accent_danger)
+        self._set_label(
+            self.info_items['sim_status'],
+            text=sim_status,
+            fg=self._c_ok if sim_status == "READY" else self._c_err
+        )
+    
+    def _module_info_failed(self, error):
+        """Show that module information could not be read"""
+        print(f"Module info query failed: {error}")
+        for label in self.info_items.values():
+            self._set_label(label, text="Error", fg=self._c_err)
     
     def _send_at_command(self):
         """Send AT command from console"""
@@ -620,21 +779,34 @@ class DiagnosticsScreen(tk.Frame):
             return
         
         # Add to output
-        self._console_write(f">>> {cmd}\n", self.colors.text_secondary)
+        self._console_write(f">>> {cmd}\n", "cmd")
         
         # Send command
         if self.modem:
-            response = self.modem.send_raw_command(cmd)
-            self._console_write(f"{response}\n\n", self.colors.accent_primary)
+            self._in_background(
+                partial(self.modem.send_raw_command, cmd),
+                self._show_at_response,
+                self._show_at_error
+            )
         else:
-            self._console_write("No modem connected\n\n", self.colors.accent_danger)
+            self._console_write("No modem connected\n\n", "err")
         
         self.cmd_entry.delete(0, tk.END)
     
+    def _show_at_response(self, response):
+        """Print a modem response in the console"""
+        self._console_write(f"{response}\n\n", "resp")
+    
+    def _show_at_error(self, error):
+        """Print a failed modem command in the console"""
+        self._console_write(f"Error: {error}\n\n", "err")
+    
     def _quick_command(self, cmd):
         """Execute quick command"""
         if cmd is None:
-            # Clear console
+            # Clear console, including anything not yet shown
+            self._pending_writes.clear()
+            self._console_lines = 0
             self.console_output.config(state=tk.NORMAL)
             self.console_output.delete(1.0, tk.END)
             self.console_output.config(state=tk.DISABLED)
@@ -643,40 +815,80 @@ class DiagnosticsScreen(tk.Frame):
             self.cmd_entry.insert(0, cmd)
             self._send_at_command()
     
-    def _console_write(self, text, color=None):
-        """Write to console output"""
+    def _console_write(self, text, tag="resp"):
+        """Queue text for the console; writes are shown in batches"""
+        self._pending_writes.append(text)
+        self._pending_writes.append(tag)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after(40, self._flush_console)
+    
+    def _flush_console(self):
+        """Append all queued writes in one edit of the console"""
+        self._flush_scheduled = False
+        if not self._pending_writes:
+            return
+        
         self.console_output.config(state=tk.NORMAL)
-        self.console_output.insert(tk.END, text)
+        # insert() takes alternating text/tag pairs
+        self.console_output.insert(tk.END, *self._pending_writes)
+        
+        # Count lines ourselves; the widget is only asked once over the cap
+        self._console_lines += sum(text.count("\n") for text in self._pending_writes[::2])
+        if self._console_lines > self.MAX_CONSOLE_LINES:
+            lines = int(self.console_output.index("end-1c").split(".")[0])
+            keep = self.MAX_CONSOLE_LINES - self.CONSOLE_TRIM_LINES
+            excess = lines - keep
+            if excess > 0:
+                self.console_output.delete("1.0", f"{excess + 1}.0")
+            self._console_lines = min(lines, keep)
+        
         self.console_output.see(tk.END)
         self.console_output.config(state=tk.DISABLED)
+        self._pending_writes.clear()
     
-    def _refresh_network(self):
+    def _refresh_network(self, force: bool = False):
         """Refresh network information"""
-        if not self.modem:
+        if not self.modem or self._refresh_busy('network', force):
             return
+        self._refresh_pending.add('network')
         
-        info = self.modem.get_network_info()
+        if force:
+            self._info_cache.pop('network_info', None)
         
+        def fetch():
+            try:
+                return self._cached('network_info', 5, self.modem.get_network_info)
+            finally:
+                self.after(self.REFRESH_DEBOUNCE_MS, self._release_refresh, 'network')
+        
+        self._in_background(fetch, self._apply_network_info, self._network_info_failed)
+    
+    def _apply_network_info(self, info):
+        """Show network information"""
         # Registration status
         if info.get('registered'):
-            self.network_items['registered'].config(
+            self._set_label(
+                self.network_items['registered'],
                 text="Registered",
-                fg=self.colors.accent_success
+                fg=self._c_ok
             )
         else:
-            self.network_items['registered'].config(
+            self._set_label(
+                self.network_items['registered'],
                 text="Not Registered",
-                fg=self.colors.accent_danger
+                fg=self._c_err
             )
         
         # Operator
-        self.network_items['operator'].config(
+        self._set_label(
+            self.network_items['operator'],
             text=info.get('operator', '--') or '--'
         )
         
         # Signal
         signal = info.get('signal', 0)
-        self.network_items['signal'].config(text=f"{signal}%")
+        self._set_label(self.network_items['signal'], text=f"{signal}%")
         
         # Current mode display
         mode_names = {
@@ -685,40 +897,38 @@ class DiagnosticsScreen(tk.Frame):
             "3g": "3G WCDMA",
             "2g": "2G GSM"
         }
-        self.network_items['mode'].config(
+        self._set_label(
+            self.network_items['mode'],
             text=mode_names.get(self.current_mode, "3G WCDMA"),
-            fg=self.colors.text_primary
+            fg=self._c_text
         )
         
         # Update signal bar
         self._draw_signal_bar(signal)
     
+    def _network_info_failed(self, error):
+        """Show that network information could not be read"""
+        print(f"Network info query failed: {error}")
+        self._set_label(self.network_items['registered'], text="Query failed", fg=self._c_err)
+    
     def _draw_signal_bar(self, strength):
         """Draw signal strength bar"""
-        self.signal_bar.delete("all")
-        
-        # Background
-        self.signal_bar.create_rectangle(
-            0, 0, 200, 12,
-            fill=self.colors.surface_light,
-            outline=""
-        )
-        
         # Signal level
         width = int(200 * (strength / 100))
         
         if strength > 70:
-            color = self.colors.accent_success
+            color = self._c_ok
         elif strength > 40:
-            color = self.colors.accent_warning
+            color = self._c_warn
         else:
-            color = self.colors.accent_danger
+            color = self._c_err
         
-        self.signal_bar.create_rectangle(
-            0, 0, width, 12,
-            fill=color,
-            outline=""
-        )
+        if (width, color) == self._signal_shown:
+            return
+        
+        self.signal_bar.coords(self._signal_level, 0, 0, width, 12)
+        self.signal_bar.itemconfigure(self._signal_level, fill=color)
+        self._signal_shown = (width, color)
     
     def _set_network_mode(self, mode: str):
         """Set network mode (LTE, 3G, 2G, Auto)"""
@@ -750,7 +960,8 @@ class DiagnosticsScreen(tk.Frame):
         }
         
         # Show status
-        self.network_items['mode'].config(
+        self._set_label(
+            self.network_items['mode'],
             text=f"Switching to {mode_names.get(mode, mode)}...",
             fg=self.colors.accent_warning
         )
@@ -764,14 +975,15 @@ class DiagnosticsScreen(tk.Frame):
         self.modem.send_raw_command("AT+COPS=0", 10)
         
         # Wait and refresh
-        self.after(3000, self._refresh_network)
+        self.after(3000, self._refresh_network, True)
     
     def _reset_modem(self):
         """Reset/reboot the modem"""
         if not self.modem:
             return
         
-        self.network_items['registered'].config(
+        self._set_label(
+            self.network_items['registered'],
             text="Resetting...",
             fg=self.colors.accent_warning
         )
@@ -800,14 +1012,15 @@ class DiagnosticsScreen(tk.Frame):
             else:
                 btn.set_colors(bg=self.colors.surface_light, fg=self.colors.text_primary)
         
-        self.after(5000, self._refresh_network)
+        self.after(5000, self._refresh_network, True)
     
     def _force_registration(self):
         """Force network re-registration"""
         if not self.modem:
             return
         
-        self.network_items['registered'].config(
+        self._set_label(
+            self.network_items['registered'],
             text="Registering...",
             fg=self.colors.accent_warning
         )
@@ -816,7 +1029,7 @@ class DiagnosticsScreen(tk.Frame):
         # Detach and re-attach
         self.modem.send_raw_command("AT+COPS=2", 5)  # Deregister
         self.after(2000, lambda: self.modem.send_raw_command("AT+COPS=0", 30))  # Re-register
-        self.after(10000, self._refresh_network)
+        self.after(10000, self._refresh_network, True)
     
     def _apply_apn(self):
         """Apply APN settings"""
@@ -849,7 +1062,7 @@ class DiagnosticsScreen(tk.Frame):
         self.apn_status.config(text=f"Current: {apn}", fg=self.colors.accent_success)
         
         # Refresh after a delay
-        self.after(5000, self._refresh_network)
+        self.after(5000, self._refresh_network, True)
     
     def _load_current_apn(self):
         """Load current APN from modem"""
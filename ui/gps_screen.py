@@ -277,12 +277,6 @@ class GPSScreen(tk.Frame):
         )
         self.compass.pack(side=tk.LEFT, padx=5)
         
-        self._draw_compass(0)
-    
-    def _draw_compass(self, heading: float):
-        """Draw compass with given heading"""
-        self.compass.delete("all")
-        
         cx, cy = 40, 40
         r = 32
         
@@ -293,38 +287,51 @@ class GPSScreen(tk.Frame):
             width=2
         )
         
-        # Cardinal directions
-        directions = [("N", 0), ("E", 90), ("S", 180), ("W", 270)]
-        for label, angle in directions:
-            rad = math.radians(angle - heading - 90)
-            x = cx + (r - 12) * math.cos(rad)
-            y = cy + (r - 12) * math.sin(rad)
-            
+        # Cardinal directions; only these move with the heading
+        self._compass_labels = []
+        for label, angle in [("N", 0), ("E", 90), ("S", 180), ("W", 270)]:
             color = self.colors.accent_danger if label == "N" else self.colors.text_muted
-            self.compass.create_text(x, y, text=label, fill=color, font=Theme.FONT_SMALL)
+            item = self.compass.create_text(cx, cy, text=label, fill=color, font=Theme.FONT_SMALL)
+            self._compass_labels.append((item, angle))
         
         # Needle
         needle_len = 25
-        rad = math.radians(-90)  # Points up (north)
         
         # North (red) side
         self.compass.create_polygon(
-            cx, cy - needle_len,
-            cx - 6, cy,
-            cx + 6, cy,
+            (cx, cy - needle_len, cx - 6, cy, cx + 6, cy),
             fill=self.colors.accent_danger
         )
         
         # South (white) side
         self.compass.create_polygon(
-            cx, cy + needle_len,
-            cx - 6, cy,
-            cx + 6, cy,
+            (cx, cy + needle_len, cx - 6, cy, cx + 6, cy),
             fill=self.colors.text_primary
         )
         
         # Center dot
         self.compass.create_oval(cx-4, cy-4, cx+4, cy+4, fill=self.colors.surface_light)
+        
+        self._compass_heading = None
+        self._draw_compass(0)
+    
+    def _draw_compass(self, heading: float):
+        """Rotate the compass card to the given heading"""
+        # Whole degrees are all the 80px dial can show
+        heading = round(heading)
+        if heading == self._compass_heading:
+            return
+        self._compass_heading = heading
+        
+        cx, cy = 40, 40
+        radius = 32 - 12
+        for item, angle in self._compass_labels:
+            rad = math.radians(angle - heading - 90)
+            self.compass.coords(
+                item,
+                int(cx + radius * math.cos(rad)),
+                int(cy + radius * math.sin(rad))
+            )
     
     def _toggle_gps(self):
         """Toggle GPS power"""
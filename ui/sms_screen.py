@@ -7,7 +7,7 @@ import tkinter as tk
 from tkinter import messagebox
 from typing import Optional, List, Dict
 from .theme import Theme, Colors
-from .components import TouchButton, ScrollableFrame, MessageBubble, KeyboardButton
+from .components import TouchButton, ScrollableFrame, KeyboardButton
 
 
 class SMSScreen(tk.Frame):
@@ -286,10 +286,19 @@ class SMSScreen(tk.Frame):
     
     def _refresh_conversation_list(self):
         """Refresh the conversation list display - compact"""
-        # Clear existing items
+        # Clear existing placeholder
         for widget in self.list_scroll.inner.winfo_children():
             widget.destroy()
         
+        # Only the rows on screen are real widgets; the list reuses them
+        # as it scrolls
+        self.list_scroll.set_items(
+            list(self.conversations.items()),
+            self._make_conversation_row,
+            self._fill_conversation_row,
+            row_height=56
+        )
+        
         if not self.conversations:
             # No messages placeholder
             tk.Label(
@@ -299,79 +308,90 @@ class SMSScreen(tk.Frame):
                 bg=self.colors.background,
                 fg=self.colors.text_muted
             ).pack(pady=30)
-            return
+    
+    def _make_conversation_row(self, parent) -> tk.Frame:
+        """Create an empty conversation list row"""
+        row = tk.Frame(parent, bg=self.colors.background)
         
-        for phone, messages in self.conversations.items():
-            # Get latest message
-            latest = messages[-1] if messages else {'content': '', 'timestamp': ''}
-            
-            item = tk.Frame(
-                self.list_scroll.inner,
-                bg=self.colors.surface,
-                cursor="hand2"
-            )
-            item.pack(fill=tk.X, padx=3, pady=2)
-            
-            # Contact info - compact
-            info_frame = tk.Frame(item, bg=self.colors.surface)
-            info_frame.pack(fill=tk.X, padx=8, pady=6)
-            
-            # Phone number
-            tk.Label(
-                info_frame,
-                text=phone,
-                font=Theme.FONT_SMALL,
-                bg=self.colors.surface,
-                fg=self.colors.text_primary,
-                anchor=tk.W
-            ).pack(fill=tk.X)
-            
-            # Preview text
-            preview = latest['content'][:35] + "..." if len(latest['content']) > 35 else latest['content']
-            tk.Label(
-                info_frame,
-                text=preview,
-                font=Theme.FONT_TINY,
-                bg=self.colors.surface,
-                fg=self.colors.text_secondary,
-                anchor=tk.W
-            ).pack(fill=tk.X)
-            
-            # Timestamp on right
-            tk.Label(
-                info_frame,
-                text=latest['timestamp'][:10] if latest['timestamp'] else '',
-                font=(Theme.FONT_FAMILY, 8),
-                bg=self.colors.surface,
-                fg=self.colors.text_muted
-            ).place(relx=1.0, y=3, anchor=tk.NE)
-            
-            # Bind click
-            item.bind("<Button-1>", lambda e, p=phone: self._show_conversation(p))
-            for child in item.winfo_children():
-                child.bind("<Button-1>", lambda e, p=phone: self._show_conversation(p))
-                for subchild in child.winfo_children():
-                    subchild.bind("<Button-1>", lambda e, p=phone: self._show_conversation(p))
+        item = tk.Frame(
+            row,
+            bg=self.colors.surface,
+            cursor="hand2"
+        )
+        item.pack(fill=tk.BOTH, expand=True, padx=3, pady=2)
+        
+        # Contact info - compact
+        info_frame = tk.Frame(item, bg=self.colors.surface)
+        info_frame.pack(fill=tk.X, padx=8, pady=6)
+        
+        # Phone number
+        row.phone_label = tk.Label(
+            info_frame,
+            font=Theme.FONT_SMALL,
+            bg=self.colors.surface,
+            fg=self.colors.text_primary,
+            anchor=tk.W
+        )
+        row.phone_label.pack(fill=tk.X)
+        
+        # Preview text
+        row.preview_label = tk.Label(
+            info_frame,
+            font=Theme.FONT_TINY,
+            bg=self.colors.surface,
+            fg=self.colors.text_secondary,
+            anchor=tk.W
+        )
+        row.preview_label.pack(fill=tk.X)
+        
+        # Timestamp on right
+        row.time_label = tk.Label(
+            info_frame,
+            font=(Theme.FONT_FAMILY, 8),
+            bg=self.colors.surface,
+            fg=self.colors.text_muted
+        )
+        row.time_label.place(relx=1.0, y=3, anchor=tk.NE)
+        
+        # Bind click; the row remembers which conversation it shows
+        row.phone = None
+        open_row = lambda e: self._show_conversation(row.phone)
+        for widget in (item, info_frame, row.phone_label,
+                       row.preview_label, row.time_label):
+            widget.bind("<Button-1>", open_row)
+        
+        return row
+    
+    def _fill_conversation_row(self, row: tk.Frame, conversation: tuple):
+        """Show a (phone, messages) conversation in a list row"""
+        phone, messages = conversation
+        
+        # Get latest message
+        latest = messages[-1] if messages else {'content': '', 'timestamp': ''}
+        
+        preview = latest['content'][:35] + "..." if len(latest['content']) > 35 else latest['content']
+        
+        row.phone = phone
+        row.phone_label.configure(text=phone)
+        row.preview_label.configure(text=preview)
+        row.time_label.configure(text=latest['timestamp'][:10] if latest['timestamp'] else '')
     
     def _refresh_messages(self):
         """Refresh messages in current conversation"""
         if not self.current_conversation:
             return
         
-        # Clear existing messages
-        for widget in self.messages_scroll.inner.winfo_children():
-            widget.destroy()
+        # Clear existing messages; their widgets are reused below
+        self.messages_scroll.release_bubbles()
         
         messages = self.conversations.get(self.current_conversation, [])
         
         for msg in messages:
-            bubble = MessageBubble(
-                self.messages_scroll.inner,
+            self.messages_scroll.acquire_bubble(
                 message=msg['content'],
                 timestamp=msg['timestamp'],
                 is_sent=msg['is_sent']
             )
-            bubble.pack(fill=tk.X)
         
         # Scroll to bottom
         self.after(100, self.messages_scroll.scroll_to_bottom)